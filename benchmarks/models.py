@@ -0,0 +1,109 @@
+"""Realistic models of different sizes and shapes for the benchmarks.
+
+The values are generated deterministically so that each run measures
+the same work.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+@dataclass
+class Small:
+    name: str
+    count: int
+    active: bool = True
+
+
+class Address(BaseModel):
+    street_name: str
+    city_name: str
+    post_code: Optional[str] = None
+
+
+class Large(BaseModel):
+    user_id: int
+    first_name: str
+    last_name: str
+    email_address: str
+    phone_number: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    is_active: bool = True
+    login_count: int = 0
+    account_balance: float = 0.0
+    tag_names: List[str] = []
+    home_address: Address
+    work_address: Optional[Address] = None
+    previous_addresses: List[Address] = []
+    extra_data: Dict[str, Any] = {}
+
+
+class Node(BaseModel):
+    node_name: str
+    node_value: int
+    child_nodes: List[Node] = []
+
+
+Node.update_forward_refs()
+
+
+@dataclass
+class Nested:
+    tree_name: str
+    root_node: Node
+
+
+@dataclass
+class Headers:
+    x_request_id: str
+    x_tenant: Optional[str] = None
+
+
+@dataclass
+class Query:
+    search_term: Optional[str] = None
+    page_number: Optional[int] = None
+    page_size: Optional[int] = None
+
+
+def small_value() -> dict:
+    return {"name": "bob", "count": 2, "active": True}
+
+
+def address_value(index: int) -> dict:
+    return {"street_name": f"{index} High Street", "city_name": "London", "post_code": "N1"}
+
+
+def large_value() -> dict:
+    return {
+        "user_id": 1,
+        "first_name": "Bob",
+        "last_name": "Smith",
+        "email_address": "bob@example.com",
+        "phone_number": "0123456789",
+        "created_at": "2021-01-01T12:00:00",
+        "is_active": True,
+        "login_count": 42,
+        "account_balance": 12.5,
+        "tag_names": [f"tag{index}" for index in range(10)],
+        "home_address": address_value(0),
+        "previous_addresses": [address_value(index) for index in range(1, 20)],
+        "extra_data": {"some_key": {"nested_key": [1, 2, 3]}},
+    }
+
+
+def node_value(depth: int, width: int = 2) -> dict:
+    return {
+        "node_name": f"node{depth}",
+        "node_value": depth,
+        "child_nodes": [node_value(depth - 1, width) for _ in range(width)] if depth > 0 else [],
+    }
+
+
+def nested_value(depth: int = 6) -> dict:
+    return {"tree_name": "tree", "root_node": node_value(depth)}
@@ -0,0 +1,89 @@
+"""Measure how the openapi build time scales.
+
+The build time should grow with the number of unique models rather
+than the number of routes that use them, run via,
+
+    python benchmarks/openapi.py
+"""
+from __future__ import annotations
+
+import timeit
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from pydantic import BaseModel, create_model
+from quart import Quart
+
+from quart_schema import QuartSchema, validate_request, validate_response
+from quart_schema.extension import _build_openapi_schema
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    postcode: Optional[str]
+
+
+def create_models(count: int) -> List[type]:
+    models = []
+    for index in range(count):
+        models.append(
+            create_model(
+                f"Model{index}",
+                name=(str, ...),
+                age=(Optional[int], None),
+                addresses=(List[Address], []),
+            )
+        )
+    return models
+
+
+def create_app(route_count: int, model_count: int) -> Quart:
+    app = Quart(__name__)
+    QuartSchema(app)
+    models = create_models(model_count)
+
+    for index in range(route_count):
+        model = models[index % model_count]
+
+        async def route() -> str:
+            return ""
+
+        route = validate_request(model)(route)
+        route = validate_response(model)(route)
+        app.add_url_rule(f"/route{index}", f"route{index}", route, methods=["POST"])
+    return app
+
+
+def measure(route_count: int, model_count: int, repeat: int = 5) -> float:
+    app = create_app(route_count, model_count)
+    extension = app.extensions["QUART_SCHEMA"]
+    return min(
+        timeit.repeat(lambda: _build_openapi_schema(app, extension), number=1, repeat=repeat)
+    )
+
+
+def benchmarks() -> Dict[str, Callable[[], None]]:
+    result = {}
+    for route_count in [10, 100, 1000, 5000]:
+        app = create_app(route_count, 10)
+        extension = app.extensions["QUART_SCHEMA"]
+        result[f"build_{route_count}_routes"] = partial(_build_openapi_schema, app, extension)
+    return result
+
+
+def main() -> None:
+    print(f"{'routes':>8} {'models':>8} {'build (ms)':>12}")
+    for route_count, model_count in [
+        (100, 10),
+        (1000, 10),
+        (5000, 10),
+        (1000, 100),
+        (1000, 1000),
+    ]:
+        duration = measure(route_count, model_count)
+        print(f"{route_count:>8} {model_count:>8} {duration * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure the per-request overhead of validation.
+
+Each benchmark makes a request via the test client, with a plain
+Quart route doing the same work as the baseline, run via,
+
+    python benchmarks/run.py routes
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict
+
+from models import Headers, Large, large_value, Nested, nested_value, Query, Small, small_value
+from quart import Quart, request
+
+from quart_schema import (
+    QuartSchema,
+    validate_headers,
+    validate_querystring,
+    validate_request,
+    validate_response,
+)
+
+
+def create_app(convert_casing: bool = False) -> Quart:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=convert_casing)
+
+    @app.post("/plain")
+    async def plain() -> Any:
+        return await request.get_json()
+
+    @app.post("/small")
+    @validate_request(Small)
+    @validate_response(Small)
+    async def small(data: Small) -> Small:
+        return data
+
+    @app.post("/large")
+    @validate_request(Large)
+    @validate_response(Large)
+    async def large(data: Large) -> Large:
+        return data
+
+    @app.post("/nested")
+    @validate_request(Nested)
+    @validate_response(Nested)
+    async def nested(data: Nested) -> Nested:
+        return data
+
+    @app.get("/query")
+    @validate_headers(Headers)
+    @validate_querystring(Query)
+    async def query(headers: Headers, query_args: Query) -> Any:
+        return {}
+
+    return app
+
+
+def request_benchmark(app: Quart, method: str, path: str, **kwargs: Any) -> Callable[[], None]:
+    loop = asyncio.new_event_loop()
+    test_client = app.test_client()
+
+    async def make_request() -> None:
+        response = await test_client.open(path, method=method, **kwargs)
+        assert response.status_code == 200, await response.get_data()
+
+    def benchmark() -> None:
+        loop.run_until_complete(make_request())
+
+    return benchmark
+
+
+def benchmarks() -> Dict[str, Callable[[], None]]:
+    app = create_app()
+    casing_app = create_app(convert_casing=True)
+    headers = {"X-Request-Id": "abc", "X-Tenant": "tenant", "User-Agent": "benchmark"}
+    headers.update({f"X-Proxy-{index}": "value" for index in range(40)})
+    query = {"search_term": "term", "page_number": "2", "page_size": "20"}
+    return {
+        "plain_small": request_benchmark(app, "POST", "/plain", json=small_value()),
+        "plain_large": request_benchmark(app, "POST", "/plain", json=large_value()),
+        "small": request_benchmark(app, "POST", "/small", json=small_value()),
+        "large": request_benchmark(app, "POST", "/large", json=large_value()),
+        "nested": request_benchmark(app, "POST", "/nested", json=nested_value()),
+        "casing_large": request_benchmark(casing_app, "POST", "/large", json=large_value()),
+        "headers_query": request_benchmark(
+            app, "GET", "/query", headers=headers, query_string=query
+        ),
+    }
@@ -0,0 +1,110 @@
+"""Run the benchmarks and compare against a saved baseline.
+
+Each benchmark module provides a ``benchmarks`` function returning a
+mapping of names to callables. The best per-call time of several
+repeats is reported, so that noise from other processes is minimised.
+A baseline can be saved and later compared against, with the run
+failing if any benchmark is slower than the tolerance allows, e.g.
+
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json --tolerance 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import timeit
+from importlib import import_module
+from importlib.metadata import version
+from typing import Callable, Dict, List, Optional
+
+MODULES = ["routes", "serialization", "openapi", "startup"]
+
+
+def measure(benchmark: Callable[[], None], repeat: int) -> float:
+    timer = timeit.Timer(benchmark)
+    number, _ = timer.autorange()
+    gc.collect()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(modules: List[str], filter_: Optional[str], repeat: int) -> Dict[str, float]:
+    results = {}
+    for module_name in modules:
+        module = import_module(module_name)
+        for name, benchmark in module.benchmarks().items():
+            full_name = f"{module_name}.{name}"
+            if filter_ is not None and filter_ not in full_name:
+                continue
+            results[full_name] = measure(benchmark, repeat)
+            print(f"{full_name:<50} {results[full_name] * 1_000_000:>12.1f} us", flush=True)
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "pydantic": version("pydantic"),
+        "quart": version("quart"),
+    }
+
+
+def compare(results: Dict[str, float], path: str, tolerance: float) -> bool:
+    with open(path) as file_:
+        baseline = json.load(file_)
+
+    if baseline["environment"] != environment():
+        print(f"Warning: baseline environment {baseline['environment']} differs")
+
+    print(f"\n{'benchmark':<50} {'baseline':>12} {'current':>12} {'change':>8}")
+    passed = True
+    for name, duration in results.items():
+        try:
+            baseline_duration = baseline["results"][name]
+        except KeyError:
+            continue
+        change = duration / baseline_duration - 1
+        regressed = change > tolerance
+        passed = passed and not regressed
+        print(
+            f"{name:<50} {baseline_duration * 1_000_000:>9.1f} us {duration * 1_000_000:>9.1f} us "
+            f"{change:>+8.1%}{' REGRESSION' if regressed else ''}"
+        )
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # Checked after parsing, as argparse rejects an empty list when
+    # choices are given for a positional with nargs="*"
+    parser.add_argument("modules", nargs="*", help=f"Any of {', '.join(MODULES)} (default all)")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="Save the results as a baseline to this path")
+    parser.add_argument("--compare", help="Compare the results to the baseline at this path")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The allowed fractional slowdown before a regression is reported",
+    )
+    args = parser.parse_args()
+    unknown = set(args.modules) - set(MODULES)
+    if unknown:
+        parser.error(f"unknown modules {', '.join(sorted(unknown))}")
+
+    results = run(args.modules or MODULES, args.filter, args.repeat)
+
+    if args.save is not None:
+        with open(args.save, "w") as file_:
+            json.dump({"environment": environment(), "results": results}, file_, indent=2)
+
+    if args.compare is not None and not compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measure the JSON encoding and decoding of models.
+
+Each benchmark encodes or decodes a single value, with the plain
+standard library json as the baseline, run via,
+
+    python benchmarks/run.py serialization
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable, Dict
+
+from models import Large, large_value, Nested, nested_value
+from pydantic import parse_obj_as
+from quart import Quart
+
+from quart_schema import QuartSchema
+from quart_schema.extension import CasingJSONDecoder, CasingJSONEncoder, convert_model_result
+
+
+def create_app(convert_casing: bool, json_backend: str = "json") -> Quart:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=convert_casing, json_backend=json_backend)
+    return app
+
+
+def provider_benchmarks(name: str, app: Quart, value: Any) -> Dict[str, Callable[[], None]]:
+    data = app.json.dumps(value)
+    return {
+        f"{name}_dumps": lambda: app.json.dumps(value),
+        f"{name}_loads": lambda: app.json.loads(data),
+    }
+
+
+def convert_benchmark(app: Quart, value: Any) -> Callable[[], None]:
+    loop = asyncio.new_event_loop()
+
+    async def convert(result: Any) -> Any:
+        return result
+
+    converter = convert_model_result(convert)
+
+    async def make_response() -> None:
+        async with app.app_context():
+            await converter(value)
+
+    def benchmark() -> None:
+        loop.run_until_complete(make_response())
+
+    return benchmark
+
+
+def benchmarks() -> Dict[str, Callable[[], None]]:
+    large = Large(**large_value())
+    nested = parse_obj_as(Nested, nested_value())
+    plain = large_value()
+    large_data = json.dumps(plain)
+    app = create_app(convert_casing=False)
+    casing_app = create_app(convert_casing=True)
+    orjson_app = create_app(convert_casing=True, json_backend="orjson")
+    return {
+        "plain_dumps": lambda: json.dumps(plain),
+        "plain_loads": lambda: json.loads(large_data),
+        "casing_encoder": lambda: json.dumps(large, cls=CasingJSONEncoder),
+        "casing_decoder": lambda: json.loads(large_data, cls=CasingJSONDecoder),
+        **provider_benchmarks("large", app, large),
+        **provider_benchmarks("nested", app, nested),
+        **provider_benchmarks("casing_large", casing_app, large),
+        **provider_benchmarks("casing_nested", casing_app, nested),
+        **provider_benchmarks("orjson_large", orjson_app, large),
+        "convert_model_result": convert_benchmark(app, large),
+        "casing_convert_model_result": convert_benchmark(casing_app, large),
+    }
@@ -0,0 +1,99 @@
+"""Measure how long an app's routes take to define and prepare.
+
+Defining the routes is the cost paid when the app is imported,
+whereas preparing them is paid before the app starts serving, run
+via,
+
+    python benchmarks/startup.py
+"""
+from __future__ import annotations
+
+import asyncio
+import timeit
+from dataclasses import make_dataclass
+from typing import Callable, Dict, List, Optional
+
+from quart import Quart
+
+from quart_schema import QuartSchema, validate_querystring, validate_request, validate_response
+
+
+def create_models(count: int) -> List[type]:
+    models = []
+    for index in range(count):
+        address = make_dataclass(
+            f"Address{index}", [("street", Optional[str], None), ("city", Optional[str], None)]
+        )
+        models.append(
+            make_dataclass(
+                f"Model{index}",
+                [
+                    ("name", Optional[str], None),
+                    ("age", Optional[int], None),
+                    ("tags", Optional[List[str]], None),
+                    ("address", Optional[address], None),  # type: ignore
+                ],
+            )
+        )
+    return models
+
+
+def create_app(models: List[type], check_schemas: bool = True) -> Quart:
+    app = Quart(__name__)
+    QuartSchema(app, check_schemas=check_schemas)
+
+    for index, model in enumerate(models):
+
+        async def route() -> str:
+            return ""
+
+        route = validate_querystring(model)(route)
+        route = validate_request(model)(route)
+        route = validate_response(model)(route)
+        app.add_url_rule(f"/route{index}", f"route{index}", route, methods=["POST"])
+    return app
+
+
+def startup_benchmark(route_count: int, check_schemas: bool) -> Callable[[], None]:
+    loop = asyncio.new_event_loop()
+
+    def benchmark() -> None:
+        # New models each time, as the conversions are remembered
+        app = create_app(create_models(route_count), check_schemas)
+        loop.run_until_complete(app.startup())
+
+    return benchmark
+
+
+def benchmarks() -> Dict[str, Callable[[], None]]:
+    return {
+        "define_100_routes": lambda: create_app(create_models(100)),
+        "startup_100_routes": startup_benchmark(100, True),
+        "startup_100_routes_unchecked": startup_benchmark(100, False),
+    }
+
+
+def main() -> None:
+    loop = asyncio.new_event_loop()
+    print(f"{'routes':>8} {'models (ms)':>12} {'define (ms)':>12} {'prepare (ms)':>13}")
+    for route_count in [10, 100, 900]:
+        models_duration = min(
+            timeit.repeat(lambda: create_models(route_count), number=1, repeat=3)
+        )
+        define_duration = startup_duration = float("inf")
+        for _ in range(3):
+            models = create_models(route_count)
+            start = timeit.default_timer()
+            app = create_app(models)
+            define_duration = min(define_duration, timeit.default_timer() - start)
+            start = timeit.default_timer()
+            loop.run_until_complete(app.startup())
+            startup_duration = min(startup_duration, timeit.default_timer() - start)
+        print(
+            f"{route_count:>8} {models_duration * 1000:>12.1f} "
+            f"{define_duration * 1000:>12.1f} {startup_duration * 1000:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
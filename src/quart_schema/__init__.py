@@ -1,9 +1,12 @@
+from .compression import disable_compression
 from .extension import hide_route, QuartSchema, security_scheme, tag
-from .mixins import SchemaValidationError
+from .mixins import SchemaValidationError, WebsocketStream
 from .typing import ResponseReturnValue
 from .validation import (
     DataSource,
+    RequestItemValidationError,
     RequestSchemaValidationError,
+    RequestStream,
     ResponseSchemaValidationError,
     validate_headers,
     validate_querystring,
@@ -13,9 +16,12 @@ from .validation import (
 
 __all__ = (
     "DataSource",
+    "disable_compression",
     "hide_route",
     "QuartSchema",
+    "RequestItemValidationError",
     "RequestSchemaValidationError",
+    "RequestStream",
     "ResponseReturnValue",
     "ResponseSchemaValidationError",
     "SchemaValidationError",
@@ -25,4 +31,5 @@ __all__ = (
     "validate_querystring",
     "validate_request",
     "validate_response",
+    "WebsocketStream",
 )
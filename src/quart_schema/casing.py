@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import humps
+from pydantic import BaseModel
+from pydantic.fields import (
+    ModelField,
+    SHAPE_DEFAULTDICT,
+    SHAPE_DEQUE,
+    SHAPE_DICT,
+    SHAPE_FROZENSET,
+    SHAPE_ITERABLE,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SEQUENCE,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+)
+from pydantic.schema import get_model
+from pydantic.utils import lenient_issubclass
+
+# The number of distinct keys whose conversion is remembered, bounded
+# as keys can come from arbitrary client data.
+KEY_CACHE_SIZE = 4096
+
+ITEMS_SHAPES = {
+    SHAPE_DEQUE,
+    SHAPE_FROZENSET,
+    SHAPE_ITERABLE,
+    SHAPE_LIST,
+    SHAPE_SEQUENCE,
+    SHAPE_SET,
+    SHAPE_TUPLE_ELLIPSIS,
+}
+VALUES_SHAPES = {SHAPE_DEFAULTDICT, SHAPE_DICT, SHAPE_MAPPING}
+
+# How a field's value is converted, OPAQUE values are left as is,
+# MODEL values are converted by the field's model, ITEMS and VALUES
+# are collections of models, and ANY values have all their keys
+# converted as the structure isn't known.
+OPAQUE, MODEL, ITEMS, VALUES, ANY = range(5)
+
+
+class CasedDict(dict):
+    """A dict whose keys have already been converted."""
+
+
+class _ModelCasing:
+    def __init__(self) -> None:
+        self.camelized: Dict[str, Tuple[str, int, Optional[_ModelCasing]]] = {}
+        self.decamelized: Dict[str, Tuple[str, int, Optional[_ModelCasing]]] = {}
+        # For custom root models, how the root value is converted
+        self.root: Optional[Tuple[int, Optional[_ModelCasing]]] = None
+
+
+_model_casings: WeakKeyDictionary[type, _ModelCasing] = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelize_key(key: Any) -> Any:
+    return humps.camelize(key)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def decamelize_key(key: Any) -> Any:
+    return humps.decamelize(key)
+
+
+def camelize(value: Any) -> Any:
+    """Convert the keys of any (nested) mappings to camelCase."""
+    return _convert_keys(value, camelize_key)
+
+
+def decamelize(value: Any) -> Any:
+    """Convert the keys of any (nested) mappings to snake_case."""
+    return _convert_keys(value, decamelize_key)
+
+
+def camelize_model_value(value: Any, model_class: Any) -> Any:
+    """Convert the keys of the *value* structured by the *model_class*.
+
+    Only the keys of the model's fields (and those of any nested
+    models) are converted, so that the contents of free-form fields
+    are left as is.
+    """
+    if not _is_model(model_class):
+        return camelize(value)
+    return _convert_model_value(value, _get_model_casing(model_class), True)
+
+
+def decamelize_model_value(value: Any, model_class: Any) -> Any:
+    """Convert the keys of the *value* structured by the *model_class*.
+
+    The inverse of :func:`camelize_model_value`.
+    """
+    if not _is_model(model_class):
+        return decamelize(value)
+    return _convert_model_value(value, _get_model_casing(model_class), False)
+
+
+def _convert_keys(value: Any, convert: Callable[[Any], Any]) -> Any:
+    if isinstance(value, list):
+        return [_convert_keys(item, convert) for item in value]
+    elif isinstance(value, CasedDict):
+        return value
+    elif isinstance(value, Mapping):
+        return {convert(key): _convert_keys(item, convert) for key, item in value.items()}
+    else:
+        return value
+
+
+def _convert_model_value(value: Any, casing: _ModelCasing, camel: bool) -> Any:
+    if casing.root is not None:
+        return _convert_field_value(value, *casing.root, camel)
+
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)  # Dataclass values are left as is by BaseModel.dict
+    if not isinstance(value, Mapping):
+        return value
+
+    table = casing.camelized if camel else casing.decamelized
+    result = CasedDict()
+    for key, item in value.items():
+        entry = table.get(key)
+        if entry is None and not camel:
+            entry = table.get(decamelize_key(key))
+
+        if entry is None:  # An extra field
+            result[camelize_key(key) if camel else key] = item
+        else:
+            name, kind, sub_casing = entry
+            result[name] = _convert_field_value(item, kind, sub_casing, camel)
+    return result
+
+
+def _convert_field_value(value: Any, kind: int, casing: Optional[_ModelCasing], camel: bool) -> Any:
+    if kind == MODEL:
+        return _convert_model_value(value, casing, camel)
+    elif kind == ITEMS and isinstance(value, (list, tuple)):
+        return [_convert_model_value(item, casing, camel) for item in value]
+    elif kind == VALUES and isinstance(value, Mapping):
+        return {key: _convert_model_value(item, casing, camel) for key, item in value.items()}
+    elif kind == ANY:
+        return camelize(value) if camel else decamelize(value)
+    else:
+        return value
+
+
+def _get_model_casing(model_class: Any) -> _ModelCasing:
+    model = get_model(model_class)
+    try:
+        return _model_casings[model]
+    except KeyError:
+        pass
+
+    casing = _ModelCasing()
+    _model_casings[model] = casing  # Before the fields, for recursive models
+    for field in model.__fields__.values():
+        kind, sub_model = _field_kind(field)
+        sub_casing = None if sub_model is None else _get_model_casing(sub_model)
+        if model.__custom_root_type__:
+            casing.root = (kind, sub_casing)
+            continue
+        camel_alias = camelize_key(field.alias)
+        casing.decamelized[field.alias] = (field.alias, kind, sub_casing)
+        casing.decamelized[camel_alias] = (field.alias, kind, sub_casing)
+        casing.camelized[field.name] = (camelize_key(field.name), kind, sub_casing)
+        casing.camelized[field.alias] = (camel_alias, kind, sub_casing)
+    return casing
+
+
+def _field_kind(field: ModelField) -> Tuple[int, Optional[type]]:
+    if _is_model(field.type_):
+        if field.shape == SHAPE_SINGLETON:
+            return MODEL, field.type_
+        elif field.shape in ITEMS_SHAPES:
+            return ITEMS, field.type_
+        elif field.shape in VALUES_SHAPES:
+            return VALUES, field.type_
+        else:
+            return ANY, None
+    elif _contains_model(field):
+        return ANY, None
+    else:
+        return OPAQUE, None
+
+
+def _contains_model(field: ModelField) -> bool:
+    return any(
+        _is_model(sub_field.type_) or _contains_model(sub_field)
+        for sub_field in (field.sub_fields or [])
+    )
+
+
+def _is_model(type_: Any) -> bool:
+    # Pydantic dataclasses (and proxies) have a __pydantic_model__
+    return lenient_issubclass(type_, BaseModel) or hasattr(type_, "__pydantic_model__")
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import gzip
+from typing import Callable, List, Optional
+
+from quart import request
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+QUART_SCHEMA_NO_COMPRESSION_ATTRIBUTE = "_quart_schema_no_compression"
+
+# Responses are compressed per request and so favour speed, whereas
+# the openapi spec is compressed once per build and so favours size.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+
+def disable_compression(func: Callable) -> Callable:
+    """Disable the compression of the route's responses.
+
+    This is useful for routes whose responses are already compressed
+    or for which the compression isn't worth the CPU time.
+
+    .. code-block:: python
+
+        @app.route("/")
+        @disable_compression
+        async def index():
+            ...
+    """
+    setattr(func, QUART_SCHEMA_NO_COMPRESSION_ATTRIBUTE, True)
+    return func
+
+
+def available_encodings() -> List[str]:
+    """The supported encodings, in order of preference."""
+    if brotli is None:
+        return ["gzip"]
+    else:
+        return ["br", "gzip"]
+
+
+def negotiate_encoding() -> Optional[str]:
+    """The encoding the client best accepts, if any."""
+    return request.accept_encodings.best_match(available_encodings())
+
+
+def compress(data: bytes, encoding: str, static: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    elif encoding == "gzip":
+        return gzip.compress(data, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL)
+    else:
+        raise ValueError(f"Unknown encoding {encoding}")
@@ -1,32 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import inspect
 import json
+import mimetypes
+import os
 import re
-from collections.abc import Mapping
-from dataclasses import asdict, is_dataclass
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import is_dataclass
+from functools import partial, wraps
 from types import new_class
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 import click
-from humps import camelize, decamelize  # type: ignore[attr-defined]
 from pydantic import BaseModel
 from pydantic.json import pydantic_encoder
-from pydantic.schema import model_schema
-from quart import current_app, Quart, render_template_string, Response, ResponseReturnValue
+from pydantic.schema import (
+    get_flat_models_from_models,
+    get_long_model_name,
+    get_model,
+    model_process_schema,
+    normalize_name,
+)
+from pydantic.typing import display_as_type
+from quart import (
+    abort,
+    current_app,
+    has_request_context,
+    Quart,
+    render_template_string,
+    request,
+    Response,
+    ResponseReturnValue,
+)
 from quart.cli import pass_script_info, ScriptInfo
 from quart.json.provider import DefaultJSONProvider
+from quart.utils import run_sync
+from quart.wrappers.response import DataBody
+from werkzeug.http import generate_etag
+from werkzeug.routing import Rule
 from werkzeug.routing.converters import NumberConverter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .casing import camelize, camelize_model_value, decamelize, decamelize_key
+from .compression import compress, negotiate_encoding, QUART_SCHEMA_NO_COMPRESSION_ATTRIBUTE
+from .formats import create_binary_formats
+from .metrics import current_observer, ENCODE, observe_stage, Observer
 from .mixins import create_test_client_mixin, RequestMixin, WebsocketMixin
-from .typing import SecuritySchemeObject, ServerObject, TagObject
+from .typing import PydanticModel, SecuritySchemeObject, ServerObject, TagObject
 from .validation import (
+    _to_pydantic_model,
     DataSource,
+    prepare_route,
     QUART_SCHEMA_HEADERS_ATTRIBUTE,
     QUART_SCHEMA_QUERYSTRING_ATTRIBUTE,
     QUART_SCHEMA_REQUEST_ATTRIBUTE,
     QUART_SCHEMA_RESPONSE_ATTRIBUTE,
+    ResponseSchemaValidationError,
 )
 
 QUART_SCHEMA_HIDDEN_ATTRIBUTE = "_quart_schema_hidden"
@@ -34,8 +71,13 @@ QUART_SCHEMA_TAG_ATTRIBUTE = "_quart_schema_tag"
 QUART_SCHEMA_SECURITY_ATTRIBUTE = "_quart_schema_security_tag"
 QUART_SCHEMA_DEPRECATED = "_quart_schema_deprecated"
 REF_PREFIX = "#/components/schemas/"
+CHECKSUM_KEY = "x-quart-schema-checksum"
 
+ORJSON_KWARGS = {"indent", "separators"}
 PATH_RE = re.compile("<(?:[^:]*:)?([^>]+)>")
+CHECKSUM_RE = re.compile(rb'"x-quart-schema-checksum":\s*"([0-9a-f]+)"')
+
+T = TypeVar("T")
 
 REDOC_TEMPLATE = """
 <head>
@@ -80,6 +122,16 @@ SWAGGER_TEMPLATE = """
 """
 
 
+# The documentation UI assets that can be served from a local folder,
+# as the file name and the config key of the URL.
+DOCS_ASSETS = (
+    ("swagger-ui-bundle.js", "QUART_SCHEMA_SWAGGER_JS_URL"),
+    ("swagger-ui.css", "QUART_SCHEMA_SWAGGER_CSS_URL"),
+    ("redoc.standalone.js", "QUART_SCHEMA_REDOC_JS_URL"),
+)
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+
 def hide_route(func: Callable) -> Callable:
     """Mark the func as hidden.
 
@@ -97,8 +149,8 @@ class PydanticJSONEncoder(json.JSONEncoder):
 
 class CasingJSONEncoder(PydanticJSONEncoder):
     def encode(self, object_: Any) -> Any:
-        if isinstance(object_, (list, Mapping)):
-            object_ = camelize(object_)
+        if is_dataclass(object_) or isinstance(object_, BaseModel):
+            object_ = camelize_model_value(pydantic_encoder(object_), type(object_))
         return super().encode(camelize(object_))
 
 
@@ -107,25 +159,102 @@ class CasingJSONDecoder(json.JSONDecoder):
         super().__init__(*args, object_hook=self.object_hook, **kwargs)
 
     def object_hook(self, object_: dict) -> Any:
-        return decamelize(object_)
+        # Nested objects have already been through this hook
+        return {decamelize_key(key): value for key, value in object_.items()}
 
 
 class JSONProvider(DefaultJSONProvider):
-    def __init__(self, app: Quart, convert_casing: bool) -> None:
+    def __init__(self, app: Quart, convert_casing: bool, json_backend: str = "json") -> None:
         super().__init__(app)
         self._convert_casing = convert_casing
+        if json_backend not in {"json", "orjson"}:
+            raise ValueError(f"Unknown JSON backend {json_backend}")
+        self._use_orjson = json_backend == "orjson" and orjson is not None
 
     def dumps(self, object_: Any, **kwargs: Any) -> str:
+        if self._use_orjson and kwargs.keys() <= ORJSON_KWARGS:
+            return self._orjson_dumps(object_, kwargs.get("indent") is not None).decode()
+
         if self._convert_casing:
             kwargs["cls"] = CasingJSONEncoder
         else:
             kwargs["cls"] = PydanticJSONEncoder
+        kwargs.setdefault("default", self._default)
         return super().dumps(object_, **kwargs)
 
     def loads(self, object_: str | bytes, **kwargs: Any) -> Any:
-        kwargs["cls"] = CasingJSONDecoder
+        convert_casing = kwargs.pop("convert_casing", self._convert_casing)
+        if self._use_orjson and not kwargs:
+            result = orjson.loads(object_)
+            if convert_casing:
+                result = decamelize(result)
+            return result
+
+        if convert_casing:
+            kwargs["cls"] = CasingJSONDecoder
         return super().loads(object_, **kwargs)
 
+    def _default(self, object_: Any) -> Any:
+        # Models are passed as is, rather than converted by
+        # convert_model_result, whereas everything else is encoded by
+        # Quart's default e.g. datetimes as HTTP dates.
+        if isinstance(object_, BaseModel):
+            return object_.dict()
+        return self.default(object_)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if not self._use_orjson:
+            return super().response(*args, **kwargs)
+
+        object_ = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._orjson_dumps(object_, indent), mimetype=self.mimetype)
+
+    def _orjson_dumps(self, object_: Any, indent: bool) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self._convert_casing:
+            if is_dataclass(object_) or isinstance(object_, BaseModel):
+                object_ = camelize_model_value(pydantic_encoder(object_), type(object_))
+            object_ = camelize(object_)
+        return orjson.dumps(object_, default=pydantic_encoder, option=option)
+
+
+class _OpenAPICache:
+    """The serialised openapi document for an app.
+
+    The operations built for each rule are kept so that only rules
+    added since the last build need to be processed when the document
+    is rebuilt. The document is compressed at most once per encoding
+    per build.
+    """
+
+    def __init__(self) -> None:
+        self.model_schemas: Optional[_ModelSchemas] = None
+        self.operations: Dict[int, Tuple[Rule, Callable, str, Dict[str, dict]]] = {}
+        self.rule_count = -1
+        self.data = b""
+        self.etag = ""
+        self.compressed: Dict[str, bytes] = {}
+
+    def set_data(self, data: bytes) -> None:
+        self.data = data
+        self.etag = generate_etag(data)
+        self.compressed = {}
+
+    async def compressed_data(self, encoding: str) -> bytes:
+        try:
+            return self.compressed[encoding]
+        except KeyError:
+            data = self.data
+            compressed = await run_sync(compress)(data, encoding, True)
+            if data is self.data:  # Not rebuilt whilst compressing
+                self.compressed[encoding] = compressed
+            return compressed
+
 
 class QuartSchema:
 
@@ -163,6 +292,51 @@ class QuartSchema:
         version: The publishable version for the app.
         security_schemes: The security schemes to be configured for this app.
         security: The security schemes to apply globally (to all routes).
+        json_backend: The library used to encode and decode JSON,
+            either ``"json"`` (the standard library) or ``"orjson"``
+            which falls back to the standard library if orjson is not
+            installed.
+        response_sample_rate: The fraction of responses to validate,
+            which can be overridden per route. If less than 1 any
+            validation failures are passed to the
+            :meth:`response_failure_handler` rather than resulting in
+            a 500 response. All responses are validated in debug mode.
+        openapi_file: The path to a spec written by the ``schema``
+            command, which is then served as is rather than being built
+            by the app. A warning is logged if the spec doesn't match
+            the app's routes.
+        observer: An object whose ``observe`` method is called with the
+            duration of each stage of validating a request, such as a
+            :class:`~quart_schema.metrics.MetricsCollector`.
+        binary_formats: The binary encodings, ``"msgpack"`` and or
+            ``"cbor"``, that validated routes accept and respond with
+            as negotiated by the ``Content-Type`` and ``Accept``
+            headers. Formats whose library is not installed are
+            ignored.
+        compression: Compress the responses of routes with validated
+            responses, and the openapi spec, with gzip or brotli (if
+            installed) as negotiated by the ``Accept-Encoding``
+            header.
+        compression_threshold: The size in bytes below which
+            responses are not compressed.
+        check_schemas: Check that the models are usable as used, for
+            example that querystring fields are optional, raising a
+            ``SchemaInvalidError`` if not. The models of all the routes
+            are prepared, and checked, before the app starts serving,
+            rather than when the routes are defined, so that importing
+            the app is quick. Checking can be disabled in production.
+        docs_assets_folder: A folder containing the documentation UI
+            assets, ``swagger-ui-bundle.js``, ``swagger-ui.css`` and
+            ``redoc.standalone.js``, to serve rather than using a CDN.
+            They are served at fingerprinted URLs with immutable
+            cache headers.
+        docs_assets_path: The path the documentation UI assets are
+            served on.
+        offload_threshold: The size in bytes of JSON, or binary,
+            request bodies at or above which they are decoded and
+            validated in a thread pool rather than on the event loop,
+            or None to always validate on the event loop.
+        offload_workers: The number of threads in the pool.
 
     """
 
@@ -180,6 +354,18 @@ class QuartSchema:
         servers: Optional[List[ServerObject]] = None,
         security_schemes: Optional[Dict[str, SecuritySchemeObject]] = None,
         security: Optional[List[Dict[str, List[str]]]] = None,
+        openapi_file: Optional[str] = None,
+        json_backend: str = "json",
+        response_sample_rate: float = 1.0,
+        observer: Optional[Observer] = None,
+        binary_formats: Iterable[str] = (),
+        compression: bool = False,
+        compression_threshold: int = 1024,
+        docs_assets_folder: Optional[str] = None,
+        docs_assets_path: str = "/docs-assets",
+        check_schemas: bool = True,
+        offload_threshold: Optional[int] = None,
+        offload_workers: int = 4,
     ) -> None:
         self.openapi_path = openapi_path
         self.redoc_ui_path = redoc_ui_path
@@ -191,6 +377,23 @@ class QuartSchema:
         self.servers = servers
         self.security_schemes = security_schemes
         self.security = security
+        self.openapi_file = openapi_file
+        self.json_backend = json_backend
+        self.response_sample_rate = response_sample_rate
+        self.observer = observer
+        self.binary_formats = create_binary_formats(binary_formats)
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.docs_assets_folder = docs_assets_folder
+        self.docs_assets_path = docs_assets_path
+        self.check_schemas = check_schemas
+        self.offload_threshold = offload_threshold
+        self.offload_workers = offload_workers
+        self._offload_executor: Optional[ThreadPoolExecutor] = None
+        self._response_failure_handler: Optional[Callable] = None
+        self._openapi_caches: WeakKeyDictionary[Quart, _OpenAPICache] = WeakKeyDictionary()
+        self._docs_assets: Dict[str, Tuple[bytes, str]] = {}
+        self._docs_pages: WeakKeyDictionary[Quart, Dict[str, str]] = WeakKeyDictionary()
         if app is not None:
             self.init_app(app)
 
@@ -203,12 +406,20 @@ class QuartSchema:
         app.websocket_class = new_class(  # type: ignore
             "Websocket", (WebsocketMixin, app.websocket_class)
         )
-        app.json = JSONProvider(app, self.convert_casing)
+        app.json = JSONProvider(app, self.convert_casing, self.json_backend)
         app.make_response = convert_model_result(app.make_response)  # type: ignore
+        app.before_serving(self._prepare_routes)
+        if self.offload_threshold is not None:
+            app.after_serving(self._shutdown_offload)
         if self.convert_casing:
             app.request_class = new_class(  # type: ignore
                 "Request", (RequestMixin, app.request_class)
             )
+        if self.compression:
+            app.after_request(self._compress_response)
+
+        if self.docs_assets_folder is not None:
+            self._load_docs_assets(app)
 
         app.config.setdefault(
             "QUART_SCHEMA_SWAGGER_JS_URL",
@@ -229,33 +440,196 @@ class QuartSchema:
                 app.add_url_rule(self.redoc_ui_path, "redoc_ui", self.redoc_ui)
             if self.swagger_ui_path is not None:
                 app.add_url_rule(self.swagger_ui_path, "swagger_ui", self.swagger_ui)
+            if self.docs_assets_folder is not None:
+                app.add_url_rule(
+                    f"{self.docs_assets_path}/<filename>", "docs_asset", self.docs_asset
+                )
+            if self.openapi_file is not None:
+                app.before_serving(self._load_openapi_file)
 
         app.cli.add_command(_schema_command)
 
+    def response_failure_handler(self, func: Callable) -> Callable:
+        """Register a function to report sampled response validation failures.
+
+        This is only called for responses validated because of the
+        ``response_sample_rate``, with the
+        ``ResponseSchemaValidationError`` as the sole argument. For
+        example,
+
+        .. code-block:: python
+
+            @quart_schema.response_failure_handler
+            async def report(error):
+                ...
+
+        If no function is registered the failures are logged.
+        """
+        self._response_failure_handler = func
+        return func
+
+    async def report_response_failure(self, error: ResponseSchemaValidationError) -> None:
+        if self._response_failure_handler is not None:
+            await current_app.ensure_async(self._response_failure_handler)(error)
+        else:
+            current_app.logger.warning(
+                "Response failed validation: %s", error.validation_error, exc_info=error
+            )
+
     @hide_route
     async def openapi(self) -> Response:
-        openapi_schema = _build_openapi_schema(current_app, self)
-        return DefaultJSONProvider(current_app._get_current_object()).response(openapi_schema)  # type: ignore # noqa: E501
+        cache = await self._get_openapi_cache(current_app._get_current_object())  # type: ignore
+        encoding = None
+        if self.compression and len(cache.data) >= self.compression_threshold:
+            encoding = negotiate_encoding()
+        # Each encoding is a different representation, with its own etag
+        etag = cache.etag if encoding is None else f"{cache.etag}-{encoding}"
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class("", status=304)
+        elif encoding is None:
+            response = current_app.response_class(cache.data, mimetype="application/json")
+        else:
+            data = await cache.compressed_data(encoding)
+            response = current_app.response_class(data, mimetype="application/json")
+            response.content_encoding = encoding
+        if self.compression:
+            response.vary.add("Accept-Encoding")
+        response.set_etag(etag)
+        return response
+
+    async def _compress_response(self, response: Response) -> Response:
+        if (
+            response.status_code in {204, 206, 304}
+            or "Content-Encoding" in response.headers
+            or not isinstance(response.response, DataBody)  # Streamed
+            or (
+                response.mimetype != "application/json"
+                and response.mimetype not in self.binary_formats
+            )
+        ):
+            return response
+
+        func = current_app.view_functions.get(request.endpoint)
+        validated = getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, None) is not None
+        if not validated or getattr(func, QUART_SCHEMA_NO_COMPRESSION_ATTRIBUTE, False):
+            return response
+
+        data = await response.get_data(as_text=False)
+        if len(data) < self.compression_threshold:
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = negotiate_encoding()
+        if encoding is not None:
+            response.set_data(compress(data, encoding))
+            response.content_encoding = encoding
+        return response
+
+    async def offload(self, func: Callable[..., T], *args: Any) -> T:
+        """Run the func in the offload thread pool.
+
+        The pool is bounded by the ``offload_workers``, with further
+        calls queued until a thread is free. The current app and
+        request are available to the func.
+        """
+        if self._offload_executor is None:
+            self._offload_executor = ThreadPoolExecutor(
+                self.offload_workers, thread_name_prefix="quart-schema"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._offload_executor, copy_context().run, partial(func, *args)
+        )
+
+    async def _shutdown_offload(self) -> None:
+        if self._offload_executor is not None:
+            self._offload_executor.shutdown(wait=False)
+            self._offload_executor = None
+
+    async def _prepare_routes(self) -> None:
+        for func in current_app.view_functions.values():
+            prepare_route(func, self.check_schemas)
+
+    async def _load_openapi_file(self) -> None:
+        await self._get_openapi_cache(current_app._get_current_object())  # type: ignore
+
+    async def _get_openapi_cache(self, app: Quart) -> _OpenAPICache:
+        cache = self._openapi_caches.setdefault(app, _OpenAPICache())
+        if self.openapi_file is not None:
+            if cache.etag == "":
+                with open(self.openapi_file, "rb") as file_:
+                    cache.set_data(file_.read())
+                match = CHECKSUM_RE.search(cache.data)
+                if match is None or match.group(1).decode() != _routes_checksum(app):
+                    app.logger.warning(
+                        "The openapi file %s does not match the app's routes", self.openapi_file
+                    )
+            return cache
+
+        rule_count = sum(1 for _ in app.url_map.iter_rules())
+        if rule_count != cache.rule_count:
+            openapi_schema = _build_openapi_schema(app, self, cache)
+            response = DefaultJSONProvider(app).response(openapi_schema)
+            cache.set_data(await response.get_data(as_text=False))
+            cache.rule_count = rule_count
+        return cache
 
     @hide_route
     async def swagger_ui(self) -> str:
-        return await render_template_string(
+        return await self._render_docs_page(
             SWAGGER_TEMPLATE,
-            title=self.title,
-            openapi_path=self.openapi_path,
             swagger_js_url=current_app.config["QUART_SCHEMA_SWAGGER_JS_URL"],
             swagger_css_url=current_app.config["QUART_SCHEMA_SWAGGER_CSS_URL"],
         )
 
     @hide_route
     async def redoc_ui(self) -> str:
-        return await render_template_string(
+        return await self._render_docs_page(
             REDOC_TEMPLATE,
-            title=self.title,
-            openapi_path=self.openapi_path,
             redoc_js_url=current_app.config["QUART_SCHEMA_REDOC_JS_URL"],
         )
 
+    @hide_route
+    async def docs_asset(self, filename: str) -> Response:
+        try:
+            data, mimetype = self._docs_assets[filename]
+        except KeyError:
+            abort(404)
+        response = current_app.response_class(data, mimetype=mimetype)
+        # The URL changes whenever the content does
+        response.cache_control.public = True
+        response.cache_control.max_age = ASSET_MAX_AGE
+        response.cache_control.immutable = True
+        return response
+
+    async def _render_docs_page(self, template: str, **context: Any) -> str:
+        # The page only depends on the configuration, so is rendered
+        # once per app.
+        pages = self._docs_pages.setdefault(current_app._get_current_object(), {})  # type: ignore
+        try:
+            return pages[template]
+        except KeyError:
+            page = await render_template_string(
+                template, title=self.title, openapi_path=self.openapi_path, **context
+            )
+            pages[template] = page
+            return page
+
+    def _load_docs_assets(self, app: Quart) -> None:
+        for filename, config_key in DOCS_ASSETS:
+            path = os.path.join(self.docs_assets_folder, filename)
+            if not os.path.isfile(path):
+                continue
+
+            with open(path, "rb") as file_:
+                data = file_.read()
+            stem, extension = os.path.splitext(filename)
+            fingerprint = hashlib.sha256(data).hexdigest()[:16]
+            fingerprinted = f"{stem}.{fingerprint}{extension}"
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            self._docs_assets[fingerprinted] = (data, mimetype)
+            app.config.setdefault(config_key, f"{self.docs_assets_path}/{fingerprinted}")
+
 
 @click.command("schema")
 @click.option(
@@ -268,6 +642,7 @@ class QuartSchema:
 def _schema_command(info: ScriptInfo, output: Optional[str]) -> None:
     app = info.load_app()
     schema = _build_openapi_schema(app, app.extensions["QUART_SCHEMA"])
+    schema[CHECKSUM_KEY] = _routes_checksum(app)
     formatted_spec = json.dumps(schema, indent=2)
     if output is not None:
         with open(output, "w") as file_:
@@ -276,18 +651,120 @@ def _schema_command(info: ScriptInfo, output: Optional[str]) -> None:
         click.echo(formatted_spec)
 
 
-def _split_definitions(schema: dict) -> Tuple[dict, dict]:
-    new_schema = schema.copy()
-    definitions = new_schema.pop("definitions", {})
-    return definitions, new_schema
+def _routes_checksum(app: Quart) -> str:
+    hash_ = hashlib.sha256()
+    model_keys: Dict[Any, str] = {}
+    for rule in app.url_map.iter_rules():
+        func = app.view_functions[rule.endpoint]
+        if rule.websocket or getattr(func, QUART_SCHEMA_HIDDEN_ATTRIBUTE, False):
+            continue
 
+        hash_.update(f"{rule.rule} {sorted(rule.methods)} {rule.endpoint}".encode())
+        hash_.update(str(list(getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {}))).encode())
+        for model in _route_models(func):
+            try:
+                key = model_keys[model]
+            except KeyError:
+                key = model_keys[model] = _model_checksum_key(model)
+            hash_.update(key.encode())
+    return hash_.hexdigest()
+
+
+def _model_checksum_key(model: PydanticModel) -> str:
+    # Only the fields' names and types, as generating the schema would
+    # cost as much as building the spec, and the fields' reprs include
+    # defaults which may differ each run.
+    fields = [
+        f"{field.alias}: {display_as_type(field.outer_type_)} {field.required}"
+        for field in get_model(model).__fields__.values()
+    ]
+    return f"{model.__module__}.{model.__qualname__} {fields}"
+
+
+class _ModelSchemas:
+    """The schemas of all the models used by an app's routes.
+
+    The models are named together, so that models with the same name
+    are given their long (module qualified) names, and the schema for
+    each model is generated once however many routes use it.
+    """
 
-def _split_convert_definitions(schema: dict, convert_casing: bool) -> Tuple[dict, dict]:
-    definitions, new_schema = _split_definitions(schema)
-    if convert_casing:
-        new_schema = camelize(new_schema)
-        definitions = {key: camelize(definition) for key, definition in definitions.items()}
-    return definitions, new_schema
+    def __init__(
+        self, models: Set[Type[BaseModel]], previous: Optional[_ModelSchemas] = None
+    ) -> None:
+        self.models = models
+        self.name_map = _get_model_name_map(models)
+        self.definitions: Dict[str, dict] = {}
+        self._schemas: Dict[Tuple[Type[BaseModel], bool], Tuple[dict, dict]] = {}
+        self.reused = previous is not None and all(
+            self.name_map.get(model) == name for model, name in previous.name_map.items()
+        )
+        if self.reused:
+            self.definitions = previous.definitions
+            self._schemas = previous._schemas
+
+    def schema(self, model_class: PydanticModel, convert_casing: bool) -> dict:
+        model = get_model(model_class)
+        key = (model, convert_casing)
+        if key not in self._schemas:
+            schema, definitions, nested_models = model_process_schema(
+                model, model_name_map=self.name_map, ref_prefix=REF_PREFIX
+            )
+            name = self.name_map[model]
+            if name in nested_models:  # Self referencing model
+                definitions[name] = schema
+                schema = {"$ref": f"{REF_PREFIX}{name}"}
+            if convert_casing:
+                schema = camelize(schema)
+                definitions = {
+                    name: camelize(definition) for name, definition in definitions.items()
+                }
+            self._schemas[key] = (definitions, schema)
+
+        definitions, schema = self._schemas[key]
+        self.definitions.update(definitions)
+        return schema
+
+
+def _get_model_name_map(models: Set[Type[BaseModel]]) -> Dict[Any, str]:
+    models_by_name: Dict[str, List[Any]] = {}
+    for model in get_flat_models_from_models(list(models)):
+        models_by_name.setdefault(normalize_name(model.__name__), []).append(model)
+
+    name_map = {}
+    for name, clashing_models in models_by_name.items():
+        if len(clashing_models) == 1:
+            name_map[clashing_models[0]] = name
+            continue
+
+        models_by_long_name: Dict[str, List[Any]] = {}
+        for model in clashing_models:
+            models_by_long_name.setdefault(get_long_model_name(model), []).append(model)
+        for long_name, long_models in models_by_long_name.items():
+            if len(long_models) == 1:
+                name_map[long_models[0]] = long_name
+            else:  # Models created dynamically with the same qualified name
+                for index, model in enumerate(long_models, start=1):
+                    name_map[model] = f"{long_name}__{index}"
+    return name_map
+
+
+def _route_models(func: Callable) -> Iterable[PydanticModel]:
+    yield from (
+        _to_pydantic_model(model)
+        for model in (
+            getattr(func, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, None),
+            getattr(func, QUART_SCHEMA_HEADERS_ATTRIBUTE, None),
+            getattr(func, QUART_SCHEMA_REQUEST_ATTRIBUTE, (None,))[0],
+        )
+        if model is not None
+    )
+    for model_class, headers_model_class in getattr(
+        func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {}
+    ).values():
+        yield _to_pydantic_model(model_class)
+        if headers_model_class is not None:
+            yield _to_pydantic_model(headers_model_class)
 
 
 def convert_model_result(func: Callable) -> Callable:
@@ -300,13 +777,12 @@ def convert_model_result(func: Callable) -> Callable:
         else:
             value = result
 
-        if is_dataclass(value):
-            dict_or_value = asdict(value)
-        elif isinstance(value, BaseModel):
-            dict_or_value = value.dict()
-        else:
-            dict_or_value = value
-        return await func((dict_or_value, status_or_headers, headers))
+        if is_dataclass(value) or isinstance(value, BaseModel):
+            observer = current_observer()
+            endpoint = request.endpoint if has_request_context() else None
+            with observe_stage(observer, endpoint, ENCODE, type(value)):
+                value = current_app.json.response(value)
+        return await func((value, status_or_headers, headers))
 
     return decorator
 
@@ -361,9 +837,11 @@ def security_scheme(schemes: Iterable[Dict[str, List[str]]]) -> Callable:
     return decorator
 
 
-def _build_openapi_schema(app: Quart, extension: QuartSchema) -> dict:
-    paths: Dict[str, dict] = {}
-    components = {"schemas": {}}  # type: ignore
+def _build_openapi_schema(
+    app: Quart, extension: QuartSchema, cache: Optional[_OpenAPICache] = None
+) -> dict:
+    rules = []
+    models: Set[Type[BaseModel]] = set()
     for rule in app.url_map.iter_rules():
         if rule.websocket:
             continue
@@ -372,122 +850,32 @@ def _build_openapi_schema(app: Quart, extension: QuartSchema) -> dict:
         if getattr(func, QUART_SCHEMA_HIDDEN_ATTRIBUTE, False):
             continue
 
-        operation_object: Dict[str, Any] = {
-            "parameters": [],
-            "responses": {},
-        }
-        if func.__doc__ is not None:
-            summary, *description = inspect.getdoc(func).splitlines()
-            operation_object["description"] = "\n".join(description)
-            operation_object["summary"] = summary
-
-        if getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE, None) is not None:
-            operation_object["tags"] = list(getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE))
-
-        if getattr(func, QUART_SCHEMA_DEPRECATED, None):
-            operation_object["deprecated"] = True
-
-        if getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE, None) is not None:
-            operation_object["security"] = list(getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE))
-
-        response_models = getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {})
-        for status_code in response_models.keys():
-            model_class, headers_model_class = response_models[status_code]
-            schema = model_schema(model_class, ref_prefix=REF_PREFIX)
-            definitions, schema = _split_convert_definitions(schema, extension.convert_casing)
-            components["schemas"].update(definitions)
-            response_object = {
-                "content": {
-                    "application/json": {
-                        "schema": schema,
-                    },
-                },
-                "description": "",
-            }
-            if model_class.__doc__ is not None:
-                response_object["description"] = inspect.getdoc(model_class)
-
-            if headers_model_class is not None:
-                schema = model_schema(headers_model_class, ref_prefix=REF_PREFIX)
-                definitions, schema = _split_definitions(schema)
-                components["schemas"].update(definitions)
-                response_object["content"]["headers"] = {  # type: ignore
-                    name.replace("_", "-"): {
-                        "schema": type_,
-                    }
-                    for name, type_ in schema["properties"].items()
-                }
-            operation_object["responses"][status_code] = response_object
-
-        request_data = getattr(func, QUART_SCHEMA_REQUEST_ATTRIBUTE, None)
-        if request_data is not None:
-            schema = model_schema(request_data[0], ref_prefix=REF_PREFIX)
-            definitions, schema = _split_convert_definitions(schema, extension.convert_casing)
-            components["schemas"].update(definitions)
-
-            if request_data[1] == DataSource.JSON:
-                encoding = "application/json"
-            else:
-                encoding = "application/x-www-form-urlencoded"
-
-            operation_object["requestBody"] = {
-                "content": {
-                    encoding: {
-                        "schema": schema,
-                    },
-                },
-            }
+        rules.append((rule, func))
+        models.update(get_model(model) for model in _route_models(func))
 
-        querystring_model = getattr(func, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, None)
-        if querystring_model is not None:
-            schema = model_schema(querystring_model, ref_prefix=REF_PREFIX)
-            definitions, schema = _split_convert_definitions(schema, extension.convert_casing)
-            components["schemas"].update(definitions)
-            for name, type_ in schema["properties"].items():
-                param = {"name": name, "in": "query", "schema": type_}
-
-                for attribute in ("description", "required", "deprecated"):
-                    if attribute in type_:
-                        param[attribute] = type_.pop(attribute)
-
-                operation_object["parameters"].append(param)
-
-        headers_model = getattr(func, QUART_SCHEMA_HEADERS_ATTRIBUTE, None)
-        if headers_model is not None:
-            schema = model_schema(headers_model, ref_prefix=REF_PREFIX)
-            definitions, schema = _split_definitions(schema)
-            components["schemas"].update(definitions)
-            for name, type_ in schema["properties"].items():
-                param = {"name": name.replace("_", "-"), "in": "header", "schema": type_}
-
-                for attribute in ("description", "required", "deprecated"):
-                    if attribute in type_:
-                        param[attribute] = type_.pop(attribute)
-
-                operation_object["parameters"].append(param)
-
-        for name, converter in rule._converters.items():
-            type_ = "string"
-            if isinstance(converter, NumberConverter):
-                type_ = "number"
-
-            operation_object["parameters"].append(
-                {
-                    "name": name,
-                    "in": "path",
-                    "required": True,
-                    "schema": {"type": type_},
-                }
-            )
-
-        path = re.sub(PATH_RE, r"{\1}", rule.rule)
-        paths.setdefault(path, {})
-
-        for method in rule.methods:
-            if method == "HEAD" or (method == "OPTIONS" and rule.provide_automatic_options):  # type: ignore  # noqa: E501
-                continue
-            paths[path][method.lower()] = operation_object
+    if cache is None:
+        model_schemas = _ModelSchemas(models)
+    elif cache.model_schemas is None or not models <= cache.model_schemas.models:
+        model_schemas = _ModelSchemas(models, cache.model_schemas)
+        if not model_schemas.reused:
+            cache.operations.clear()
+        cache.model_schemas = model_schemas
+    else:
+        model_schemas = cache.model_schemas
 
+    paths: Dict[str, dict] = {}
+    for rule, func in rules:
+        cached = None if cache is None else cache.operations.get(id(rule))
+        if cached is None or cached[0] is not rule or cached[1] is not func:
+            path, operations = _build_rule_operations(rule, func, extension, model_schemas)
+            cached = (rule, func, path, operations)
+            if cache is not None:
+                cache.operations[id(rule)] = cached
+
+        _, _, path, operations = cached
+        paths.setdefault(path, {}).update(operations)
+
+    components: Dict[str, dict] = {"schemas": model_schemas.definitions}
     if extension.security_schemes is not None:
         components["securitySchemes"] = extension.security_schemes
 
@@ -507,3 +895,132 @@ def _build_openapi_schema(app: Quart, extension: QuartSchema) -> dict:
     if extension.servers is not None:
         openapi_schema["servers"] = extension.servers
     return openapi_schema
+
+
+def _build_rule_operations(
+    rule: Rule, func: Callable, extension: QuartSchema, model_schemas: _ModelSchemas
+) -> Tuple[str, Dict[str, dict]]:
+    operation_object: Dict[str, Any] = {
+        "parameters": [],
+        "responses": {},
+    }
+    if func.__doc__ is not None:
+        summary, *description = inspect.getdoc(func).splitlines()
+        operation_object["description"] = "\n".join(description)
+        operation_object["summary"] = summary
+
+    if getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE, None) is not None:
+        operation_object["tags"] = list(getattr(func, QUART_SCHEMA_TAG_ATTRIBUTE))
+
+    if getattr(func, QUART_SCHEMA_DEPRECATED, None):
+        operation_object["deprecated"] = True
+
+    if getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE, None) is not None:
+        operation_object["security"] = list(getattr(func, QUART_SCHEMA_SECURITY_ATTRIBUTE))
+
+    response_models = getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {})
+    for status_code in response_models.keys():
+        model_class, headers_model_class = response_models[status_code]
+        model_class = _to_pydantic_model(model_class)
+        schema = model_schemas.schema(model_class, extension.convert_casing)
+        response_object = {
+            "content": {
+                "application/json": {
+                    "schema": schema,
+                },
+                **{mimetype: {"schema": schema} for mimetype in extension.binary_formats},
+            },
+            "description": "",
+        }
+        if model_class.__doc__ is not None:
+            response_object["description"] = inspect.getdoc(model_class)
+
+        if headers_model_class is not None:
+            schema = model_schemas.schema(_to_pydantic_model(headers_model_class), False)
+            response_object["content"]["headers"] = {  # type: ignore
+                name.replace("_", "-"): {
+                    "schema": type_,
+                }
+                for name, type_ in schema["properties"].items()
+            }
+        operation_object["responses"][status_code] = response_object
+
+    request_data = getattr(func, QUART_SCHEMA_REQUEST_ATTRIBUTE, None)
+    if request_data is not None:
+        body_schema = model_schemas.schema(
+            _to_pydantic_model(request_data[0]), extension.convert_casing
+        )
+
+        if request_data[1] == DataSource.JSON:
+            encoding = "application/json"
+        elif request_data[1] == DataSource.JSON_STREAM:
+            encoding = "application/json"
+            body_schema = {"type": "array", "items": body_schema}
+        elif request_data[1] == DataSource.NDJSON:
+            encoding = "application/x-ndjson"
+        elif request_data[1] == DataSource.FORM_MULTIPART:
+            encoding = "multipart/form-data"
+        else:
+            encoding = "application/x-www-form-urlencoded"
+
+        operation_object["requestBody"] = {
+            "content": {
+                encoding: {
+                    "schema": body_schema,
+                },
+            },
+        }
+        if request_data[1] == DataSource.JSON:
+            for mimetype in extension.binary_formats:
+                operation_object["requestBody"]["content"][mimetype] = {"schema": body_schema}
+
+    querystring_model = getattr(func, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, None)
+    if querystring_model is not None:
+        schema = model_schemas.schema(
+            _to_pydantic_model(querystring_model), extension.convert_casing
+        )
+        for name, property_ in schema["properties"].items():
+            type_ = property_.copy()
+            param = {"name": name, "in": "query", "schema": type_}
+
+            for attribute in ("description", "required", "deprecated"):
+                if attribute in type_:
+                    param[attribute] = type_.pop(attribute)
+
+            operation_object["parameters"].append(param)
+
+    headers_model = getattr(func, QUART_SCHEMA_HEADERS_ATTRIBUTE, None)
+    if headers_model is not None:
+        schema = model_schemas.schema(_to_pydantic_model(headers_model), False)
+        for name, property_ in schema["properties"].items():
+            type_ = property_.copy()
+            param = {"name": name.replace("_", "-"), "in": "header", "schema": type_}
+
+            for attribute in ("description", "required", "deprecated"):
+                if attribute in type_:
+                    param[attribute] = type_.pop(attribute)
+
+            operation_object["parameters"].append(param)
+
+    for name, converter in rule._converters.items():
+        type_ = "string"
+        if isinstance(converter, NumberConverter):
+            type_ = "number"
+
+        operation_object["parameters"].append(
+            {
+                "name": name,
+                "in": "path",
+                "required": True,
+                "schema": {"type": type_},
+            }
+        )
+
+    path = re.sub(PATH_RE, r"{\1}", rule.rule)
+    operations = {}
+    for method in rule.methods:
+        if method == "HEAD" or (method == "OPTIONS" and rule.provide_automatic_options):  # type: ignore  # noqa: E501
+            continue
+        operations[method.lower()] = operation_object
+
+    return path, operations
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import is_dataclass
+from datetime import timezone
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+from quart import current_app, request
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+from .casing import camelize, camelize_model_value
+
+JSON_MIMETYPE = "application/json"
+CBOR_MIMETYPE = "application/cbor"
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+class BinaryFormat:
+    """A binary encoding that can be used instead of JSON.
+
+    Arguments:
+        name: The name used to configure the format.
+        mimetype: The mimetype used to negotiate the format.
+        loads: Decodes bytes, raising a ValueError if malformed.
+        dumps: Encodes a JSON compatible value to bytes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mimetype: str,
+        loads: Callable[[bytes], Any],
+        dumps: Callable[[Any], bytes],
+    ) -> None:
+        self.name = name
+        self.mimetype = mimetype
+        self._loads = loads
+        self._dumps = dumps
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+    def dumps(self, value: Any, convert_casing: bool = False) -> bytes:
+        # Matches the preparation done by the JSON provider
+        if convert_casing:
+            if is_dataclass(value) or isinstance(value, BaseModel):
+                value = camelize_model_value(pydantic_encoder(value), type(value))
+            value = camelize(value)
+        return self._dumps(value)
+
+
+def _cbor_loads(data: bytes) -> Any:
+    try:
+        return cbor2.loads(data)
+    except cbor2.CBORDecodeError as error:
+        raise ValueError(str(error))
+
+
+def _cbor_default(encoder: Any, value: Any) -> None:
+    encoder.encode(pydantic_encoder(value))
+
+
+def _cbor_dumps(value: Any) -> bytes:
+    # Naive datetimes are encoded as UTC, as CBOR requires a timezone
+    return cbor2.dumps(value, default=_cbor_default, timezone=timezone.utc)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    try:
+        return msgpack.unpackb(data)
+    except msgpack.UnpackException as error:
+        raise ValueError(str(error))
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, default=pydantic_encoder)
+
+
+def create_binary_formats(names: Iterable[str]) -> Dict[str, BinaryFormat]:
+    """Create the named formats, keyed by mimetype.
+
+    Formats whose library is not installed are left out.
+    """
+    formats = {}
+    for name in names:
+        if name == "cbor":
+            if cbor2 is not None:
+                formats[CBOR_MIMETYPE] = BinaryFormat(name, CBOR_MIMETYPE, _cbor_loads, _cbor_dumps)
+        elif name == "msgpack":
+            if msgpack is not None:
+                formats[MSGPACK_MIMETYPE] = BinaryFormat(
+                    name, MSGPACK_MIMETYPE, _msgpack_loads, _msgpack_dumps
+                )
+        else:
+            raise ValueError(f"Unknown binary format {name}")
+    return formats
+
+
+def binary_formats() -> Dict[str, BinaryFormat]:
+    extension = current_app.extensions.get("QUART_SCHEMA")
+    return {} if extension is None else extension.binary_formats
+
+
+def binary_format_named(name: str) -> BinaryFormat:
+    for format_ in binary_formats().values():
+        if format_.name == name:
+            return format_
+    raise ValueError(f"Binary format {name} is not enabled or installed")
+
+
+def request_binary_format() -> Optional[BinaryFormat]:
+    """The format of the request body, if a binary format."""
+    formats = binary_formats()
+    if not formats:
+        return None
+    return formats.get(request.mimetype)
+
+
+def response_binary_format() -> Optional[BinaryFormat]:
+    """The format the client best accepts, if a binary format."""
+    formats = binary_formats()
+    if not formats:
+        return None
+    return formats.get(request.accept_mimetypes.best_match([JSON_MIMETYPE, *formats]))
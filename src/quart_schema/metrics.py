@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from time import perf_counter
+from types import TracebackType
+from typing import Any, ContextManager, Dict, List, Optional, Sequence, Tuple, Type
+
+from quart import current_app
+
+from .typing import Protocol
+
+# The stages of a request that are observed
+HEADERS = "headers"
+QUERYSTRING = "querystring"
+READ = "read"
+DECODE = "decode"
+REQUEST = "request"
+HANDLER = "handler"
+RESPONSE = "response"
+ENCODE = "encode"
+
+# The histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Observer(Protocol):
+    def observe(
+        self, endpoint: str, stage: str, model: Optional[type], duration: float, failed: bool
+    ) -> None:
+        ...
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last is +Inf
+        self.count = 0
+        self.failures = 0
+        self.sum = 0.0
+
+    def observe(self, duration: float, failed: bool) -> None:
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        if failed:
+            self.failures += 1
+
+
+class MetricsCollector:
+    """An in-memory collector of stage duration histograms.
+
+    Set as the QuartSchema observer to collect a histogram per
+    endpoint, stage, and model, e.g.
+
+    .. code-block:: python
+
+        metrics = MetricsCollector()
+        QuartSchema(app, observer=metrics)
+
+        @app.get("/metrics")
+        async def get_metrics():
+            return {"metrics": metrics.export()}
+
+    Arguments:
+        buckets: The histogram bucket upper bounds in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = sorted(buckets)
+        self.histograms: Dict[Tuple[str, str, Optional[str]], Histogram] = {}
+
+    def observe(
+        self, endpoint: str, stage: str, model: Optional[type], duration: float, failed: bool
+    ) -> None:
+        # Qualified, so that models with the same name are kept apart
+        name = None if model is None else f"{model.__module__}.{model.__qualname__}"
+        key = (endpoint, stage, name)
+        try:
+            histogram = self.histograms[key]
+        except KeyError:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(duration, failed)
+
+    def export(self) -> List[Dict[str, Any]]:
+        """Export the histograms, with cumulative bucket counts."""
+        result = []
+        for (endpoint, stage, model), histogram in self.histograms.items():
+            buckets = {}
+            cumulative = 0
+            for bound, count in zip([*self.buckets, float("inf")], histogram.counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            result.append(
+                {
+                    "endpoint": endpoint,
+                    "stage": stage,
+                    "model": model,
+                    "count": histogram.count,
+                    "failures": histogram.failures,
+                    "sum": histogram.sum,
+                    "buckets": buckets,
+                }
+            )
+        return result
+
+    def clear(self) -> None:
+        self.histograms.clear()
+
+
+class _Stage:
+    def __init__(self, observer: Observer, endpoint: str, stage: str, model: Any) -> None:
+        self.observer = observer
+        self.endpoint = endpoint
+        self.stage = stage
+        self.model = model
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        duration = perf_counter() - self.start
+        model = getattr(self.model, "__dataclass__", self.model)
+        self.observer.observe(self.endpoint, self.stage, model, duration, exc_type is not None)
+
+
+class _NullStage:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_null_stage = _NullStage()
+
+
+def current_observer() -> Optional[Observer]:
+    extension = current_app.extensions.get("QUART_SCHEMA")
+    return None if extension is None else extension.observer
+
+
+def observe_stage(
+    observer: Optional[Observer], endpoint: Optional[str], stage: str, model: Any = None
+) -> ContextManager[None]:
+    """Time the code within the context as the *stage*, if observed."""
+    if observer is None:
+        return _null_stage
+    else:
+        return _Stage(observer, endpoint or "", stage, model)
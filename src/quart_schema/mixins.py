@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import weakref
 from dataclasses import asdict, is_dataclass
-from typing import Any, AnyStr, cast, Dict, Optional, overload, Tuple, Type, Union
+from types import TracebackType
+from typing import (
+    Any,
+    AnyStr,
+    Callable,
+    cast,
+    Dict,
+    Generic,
+    Iterable,
+    Optional,
+    overload,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from humps import camelize, decamelize  # type: ignore[attr-defined]
 from pydantic import BaseModel, ValidationError
-from quart import Response
+from quart import current_app, Response
 from quart.datastructures import FileStorage
 from quart.testing.utils import sentinel
 from werkzeug.datastructures import Authorization, Headers, MultiDict
 
+from .casing import camelize, decamelize, decamelize_key
+from .formats import binary_format_named
 from .typing import BM, DC, TestClientProtocol, WebsocketProtocol
 
 
@@ -19,42 +37,247 @@ class SchemaValidationError(Exception):
         self.validation_error = validation_error
 
 
+T = TypeVar("T")
+
+
+class WebsocketStream(Generic[T]):
+    """An async iterator of the validated messages received.
+
+    An invalid message raises a `SchemaValidationError` which, if
+    caught, can be skipped by continuing the iteration. If
+    *max_queue* is given messages are received ahead, into a queue of
+    at most that many messages, whilst the previous messages are
+    processed. Once the queue is full no more messages are received
+    until there is space, applying backpressure to the client.
+
+    The receiving ahead stops when the stream is closed, either
+    explicitly, on leaving its async context, or once it is no longer
+    referenced e.g. after breaking out of an ``async for`` loop.
+    """
+
+    def __init__(
+        self,
+        websocket: WebsocketProtocol,
+        model_class: Type[T],
+        max_queue: Optional[int],
+        binary_format: Optional[str] = None,
+    ) -> None:
+        self._websocket = websocket
+        self._model_class = model_class
+        self._loads, _ = _message_codec(binary_format)
+        self._queue: Optional[asyncio.Queue] = None
+        if max_queue is not None:
+            self._queue = asyncio.Queue(max_queue)
+        self._task: Optional[asyncio.Future] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def __aiter__(self) -> WebsocketStream[T]:
+        return self
+
+    async def __aenter__(self) -> WebsocketStream[T]:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    async def __anext__(self) -> T:
+        if self._queue is None:
+            data = await self._websocket.receive()
+        else:
+            data = await self._receive_queued(self._queue)
+
+        try:
+            return self._model_class(**self._loads(data))
+        except ValidationError as error:
+            raise SchemaValidationError(error)
+
+    def close(self) -> None:
+        """Stop receiving messages ahead into the queue."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    async def _receive_queued(self, queue: asyncio.Queue) -> Union[str, bytes]:
+        if self._task is None:
+            # The task must not refer to the stream, so that the stream
+            # can be finalized, cancelling the task, if not closed.
+            self._task = asyncio.ensure_future(_receive_ahead(self._websocket, queue))
+            self._finalizer = weakref.finalize(self, self._task.cancel)
+
+        # Messages received before the receiving stopped are returned
+        # before the error that stopped it is raised.
+        if not queue.empty() or self._task.done():
+            return self._queued_or_raise(queue, self._task)
+
+        get = asyncio.ensure_future(queue.get())
+        try:
+            await asyncio.wait({get, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            # Most likely the websocket handler has been cancelled
+            get.cancel()
+            self.close()
+            raise
+
+        if get.done():
+            return get.result()
+        else:
+            get.cancel()
+            return self._queued_or_raise(queue, self._task)
+
+    @staticmethod
+    def _queued_or_raise(queue: asyncio.Queue, task: asyncio.Future) -> Union[str, bytes]:
+        try:
+            return queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return task.result()  # Raises the error that stopped the receiving
+
+
+async def _receive_ahead(websocket: WebsocketProtocol, queue: asyncio.Queue) -> None:
+    while True:
+        await queue.put(await websocket.receive())
+
+
 class WebsocketMixin:
     @overload
-    async def receive_as(self: WebsocketProtocol, model_class: Type[BM]) -> BM:
+    async def receive_as(
+        self: WebsocketProtocol, model_class: Type[BM], binary_format: Optional[str] = None
+    ) -> BM:
         ...
 
     @overload
-    async def receive_as(self: WebsocketProtocol, model_class: Type[DC]) -> DC:
+    async def receive_as(
+        self: WebsocketProtocol, model_class: Type[DC], binary_format: Optional[str] = None
+    ) -> DC:
         ...
 
     async def receive_as(
-        self: WebsocketProtocol, model_class: Union[Type[BM], Type[DC]]
+        self: WebsocketProtocol,
+        model_class: Union[Type[BM], Type[DC]],
+        binary_format: Optional[str] = None,
     ) -> Union[BM, DC]:
-        data = await self.receive_json()
+        """Receive a message validated as the *model_class*.
+
+        Arguments:
+            model_class: The model to validate the message against.
+            binary_format: The name of an enabled binary format, e.g.
+                ``"msgpack"``, to decode the message with rather than
+                JSON.
+        """
+        loads, _ = _message_codec(binary_format)
+        data = loads(await self.receive())
         try:
             return model_class(**data)
         except ValidationError as error:
             raise SchemaValidationError(error)
 
+    @overload
+    def iter_as(
+        self: WebsocketProtocol,
+        model_class: Type[BM],
+        max_queue: Optional[int] = None,
+        binary_format: Optional[str] = None,
+    ) -> WebsocketStream[BM]:
+        ...
+
+    @overload
+    def iter_as(
+        self: WebsocketProtocol,
+        model_class: Type[DC],
+        max_queue: Optional[int] = None,
+        binary_format: Optional[str] = None,
+    ) -> WebsocketStream[DC]:
+        ...
+
+    def iter_as(
+        self: WebsocketProtocol,
+        model_class: Union[Type[BM], Type[DC]],
+        max_queue: Optional[int] = None,
+        binary_format: Optional[str] = None,
+    ) -> Union[WebsocketStream[BM], WebsocketStream[DC]]:
+        """Iterate over the received messages validated as the *model_class*.
+
+        Arguments:
+            model_class: The model to validate each message against.
+            max_queue: If given, the number of messages to receive
+                ahead whilst earlier messages are processed.
+            binary_format: The name of an enabled binary format to
+                decode the messages with rather than JSON.
+        """
+        return WebsocketStream(self, model_class, max_queue, binary_format)  # type: ignore
+
     async def send_as(
-        self: WebsocketProtocol, value: Any, model_class: Union[Type[BM], Type[DC]]
+        self: WebsocketProtocol,
+        value: Any,
+        model_class: Union[Type[BM], Type[DC]],
+        binary_format: Optional[str] = None,
     ) -> None:
-        if isinstance(value, dict):
-            try:
-                model_value = model_class(**value)
-            except ValidationError as error:
-                raise SchemaValidationError(error)
-        elif type(value) == model_class:
-            model_value = value
-        else:
-            raise SchemaValidationError()
-        if is_dataclass(model_value):
-            data = asdict(model_value)
-        else:
-            model_value = cast(BM, model_value)
-            data = model_value.dict()
-        await self.send_json(data)
+        """Send the *value* as a message, validated as the *model_class*.
+
+        Arguments:
+            value: The value to send.
+            model_class: The model to validate the value against.
+            binary_format: The name of an enabled binary format to
+                encode the message with, as a binary frame, rather
+                than JSON.
+        """
+        _, dumps = _message_codec(binary_format)
+        await self.send(dumps(_model_data(value, model_class)))
+
+    async def send_many_as(
+        self: WebsocketProtocol,
+        values: Iterable[Any],
+        model_class: Union[Type[BM], Type[DC]],
+        binary_format: Optional[str] = None,
+    ) -> None:
+        """Send each of the *values* as a message, validated as the *model_class*.
+
+        All the values are validated and encoded before any are sent,
+        so that an invalid value results in no messages being sent.
+        """
+        _, dumps = _message_codec(binary_format)
+        messages = [dumps(_model_data(value, model_class)) for value in values]
+        for message in messages:
+            await self.send(message)
+
+
+def _message_codec(
+    binary_format: Optional[str],
+) -> Tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    if binary_format is None:
+        return current_app.json.loads, current_app.json.dumps
+
+    format_ = binary_format_named(binary_format)
+    convert_casing = current_app.extensions["QUART_SCHEMA"].convert_casing
+
+    def loads(data: bytes) -> Any:
+        result = format_.loads(data)
+        return decamelize(result) if convert_casing else result
+
+    def dumps(value: Any) -> bytes:
+        return format_.dumps(value, convert_casing)
+
+    return loads, dumps
+
+
+def _model_data(value: Any, model_class: Union[Type[BM], Type[DC]]) -> dict:
+    if isinstance(value, dict):
+        try:
+            model_value = model_class(**value)
+        except ValidationError as error:
+            raise SchemaValidationError(error)
+    elif type(value) == model_class:
+        model_value = value
+    else:
+        raise SchemaValidationError()
+    if is_dataclass(model_value):
+        return asdict(model_value)
+    else:
+        model_value = cast(BM, model_value)
+        return model_value.dict()
 
 
 def create_test_client_mixin(convert_casing: bool) -> Type:
@@ -114,4 +337,13 @@ def create_test_client_mixin(convert_casing: bool) -> Type:
 class RequestMixin:
     @property
     def args(self) -> MultiDict[str, str]:
-        return decamelize(super().args)  # type: ignore
+        # Converted on first access and then cached on the request,
+        # keeping every value of repeated keys.
+        try:
+            return self._decamelized_args  # type: ignore
+        except AttributeError:
+            args = super().args  # type: ignore
+            self._decamelized_args = args.__class__(
+                (decamelize_key(key), value) for key, value in args.items(multi=True)
+            )
+            return self._decamelized_args
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterator
+
+from quart.datastructures import FileStorage
+
+
+class File(FileStorage):
+    """A file uploaded as part of a multipart form.
+
+    Use as the type of a model's field to receive the uploaded file,
+    e.g. ``avatar: File``. The size of an upload can be limited via
+    the field's ``max_size``, e.g. ``avatar: File = Field(...,
+    max_size=1024)``.
+    """
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> FileStorage:
+        if not isinstance(value, FileStorage):
+            raise TypeError("expected an uploaded file")
+        return value
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="string", format="binary")
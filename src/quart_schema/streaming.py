@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import re
+from itertools import accumulate
+from typing import Any, List
+
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+STRING_TOKEN_RE = re.compile(STRING_PATTERN, re.DOTALL)
+# A whole string, or the characters that nest or may end an item.
+TOKEN_RE = re.compile(STRING_PATTERN + r"|[\[\]{},]", re.DOTALL)
+# Any text up to a string that continues in the next part.
+COMPLETE_RE = re.compile(r'(?:[^"]+|' + STRING_PATTERN + ")*", re.DOTALL)
+# The nesting characters outside of strings, and their depth changes.
+NON_BRACKET_RE = re.compile(r"[^\[\]{}]+")
+BRACKET_DEPTHS = {"[": 1, "{": 1, "]": -1, "}": -1}
+# The rest of a string up to its closing quote or a trailing escape.
+STRING_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# The characters that may continue a number in the next part.
+NUMBER_TAIL_RE = re.compile(r"[0-9.eE+\-]*")
+
+# The states of the JSON array parser, expecting the opening bracket,
+# a value or the closing bracket, a value, a separator, or nothing.
+START, FIRST_VALUE, VALUE, SEPARATOR, END = range(5)
+
+
+class JSONArrayParser:
+    """Parse the items of a JSON array incrementally.
+
+    Only the text of the item currently being parsed is held, so that
+    the memory used is bounded by the largest item rather than by the
+    whole array. The text is scanned once for the nesting depth and
+    strings, so that decoding is only attempted once an item may have
+    ended.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._length = 0
+        self._decoder = json.JSONDecoder()
+        self._state = START
+        self._reset_scan()
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        """Parse the *text* returning any items completed by it.
+
+        Arguments:
+            text: The next part of the array's text.
+            final: Whether this is the last part, in which case the
+                array must be complete.
+        """
+        ended_at = self._ended_at
+        self._scan(text)
+        self._parts.append(text)
+        self._length += len(text)
+        if self._ended_at == ended_at and not final:
+            return []  # No item can have ended in this text
+
+        buffer = "".join(self._parts)
+        items = []
+        position = 0
+        while True:
+            position = WHITESPACE_RE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+
+            if self._state == START:
+                if buffer[position] != "[":
+                    raise ValueError("Expecting a JSON array")
+                position += 1
+                self._state = FIRST_VALUE
+            elif self._state == FIRST_VALUE and buffer[position] == "]":
+                position += 1
+                self._state = END
+            elif self._state in {FIRST_VALUE, VALUE}:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # An item that has ended, yet fails to decode, is
+                    # invalid rather than incomplete.
+                    if final or self._ended_at > position:
+                        raise
+                    break  # Incomplete, wait for more text
+                # A value at the end of the text (e.g. a number) may
+                # continue in the next part.
+                if not final and NUMBER_TAIL_RE.fullmatch(buffer, end):
+                    break
+                items.append(item)
+                position = end
+                self._state = SEPARATOR
+            elif self._state == SEPARATOR:
+                if buffer[position] == ",":
+                    self._state = VALUE
+                elif buffer[position] == "]":
+                    self._state = END
+                else:
+                    raise ValueError("Expecting ',' or ']' after an array item")
+                position += 1
+            else:
+                raise ValueError("Extra data after the JSON array")
+
+        if final and self._state != END:
+            raise ValueError("Incomplete JSON array")
+
+        remainder = buffer[position:]
+        self._parts = [remainder]
+        self._length = 0
+        self._reset_scan()
+        self._scan(remainder)
+        self._length = len(remainder)
+        return items
+
+    def _reset_scan(self) -> None:
+        # The depth is relative to the array's items, hence -1 before
+        # the opening bracket.
+        self._depth = -1 if self._state == START else 0
+        self._in_string = False
+        self._escaped = False
+        self._ended_at = -1  # The position after the last possible item end
+
+    def _scan(self, text: str) -> None:
+        position = 0
+        if self._escaped and text != "":
+            position = 1
+            self._escaped = False
+        if self._in_string:
+            position = self._scan_string(text, position)
+            if self._in_string:
+                return
+
+        end = COMPLETE_RE.match(text, position).end()
+        brackets = NON_BRACKET_RE.sub("", STRING_TOKEN_RE.sub("", text[position:end]))
+        changes = [BRACKET_DEPTHS[bracket] for bracket in brackets]
+        if min(accumulate(changes, initial=self._depth)) > 0:
+            # No item can end in this text, so only the depth matters.
+            self._depth += sum(changes)
+        else:
+            for match in TOKEN_RE.finditer(text, position, end):
+                token = match.group()
+                if token in {"[", "{"}:
+                    self._depth += 1
+                    continue
+                elif token in {"]", "}"}:
+                    self._depth -= 1
+                if self._depth <= 0:
+                    self._ended_at = self._length + match.end()
+
+        if end < len(text):
+            self._in_string = True
+            self._scan_string(text, end + 1)
+
+    def _scan_string(self, text: str, position: int) -> int:
+        position = STRING_RE.match(text, position).end()
+        if position < len(text) and text[position] == "\\":
+            self._escaped = True  # The escaped character is in the next part
+        elif position < len(text):
+            position += 1
+            self._in_string = False
+            if self._depth <= 0:
+                self._ended_at = self._length + position
+        return position
+
+
+class NDJSONParser:
+    """Parse newline delimited JSON incrementally.
+
+    Only the text of the line currently being received is held, blank
+    lines are ignored.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        """Parse the *text* returning any items completed by it.
+
+        Arguments:
+            text: The next part of the text.
+            final: Whether this is the last part, in which case the
+                last line needn't end with a newline.
+        """
+        *lines, tail = text.split("\n")
+        if lines:
+            lines[0] = "".join(self._parts) + lines[0]
+            self._parts = []
+        if tail != "":
+            self._parts.append(tail)
+        if final:
+            lines.append("".join(self._parts))
+            self._parts = []
+        return [json.loads(line) for line in lines if line.strip()]
@@ -38,6 +38,12 @@ ResponseReturnValue = Union[
 
 
 class WebsocketProtocol(Protocol):
+    async def receive(self) -> AnyStr:
+        ...
+
+    async def send(self, data: AnyStr) -> None:
+        ...
+
     async def receive_json(self) -> dict:
         ...
 
@@ -1,23 +1,89 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+from collections import deque
 from dataclasses import asdict, is_dataclass
 from enum import auto, Enum
-from functools import wraps
-from typing import Any, Callable, cast, Dict, Optional, Tuple, Type, TypeVar, Union
-
-from pydantic import BaseModel, ValidationError
+from functools import lru_cache, wraps
+from inspect import isasyncgen
+from random import random
+from tempfile import SpooledTemporaryFile
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    cast,
+    Deque,
+    Dict,
+    Hashable,
+    IO,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseConfig, BaseModel, create_model, Extra, ValidationError
 from pydantic.dataclasses import dataclass as pydantic_dataclass
-from pydantic.schema import model_schema
-from quart import current_app, request, ResponseReturnValue as QuartResponseReturnValue
-from werkzeug.datastructures import Headers
-from werkzeug.exceptions import BadRequest
-
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.schema import get_model, model_schema
+from pydantic.typing import display_as_type, get_origin
+from pydantic.utils import lenient_issubclass
+from pydantic.validators import BOOL_FALSE, BOOL_TRUE
+from quart import (
+    current_app,
+    request,
+    Response,
+    ResponseReturnValue as QuartResponseReturnValue,
+    stream_with_context,
+)
+from quart.datastructures import FileStorage
+from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge, RequestTimeout
+from werkzeug.http import parse_options_header
+from werkzeug.sansio.multipart import (
+    Data,
+    Epilogue,
+    Field as MultipartField,
+    File as MultipartFile,
+    MultipartDecoder,
+    NeedData,
+)
+
+from .casing import camelize_model_value, decamelize_model_value
+from .formats import (
+    BinaryFormat,
+    binary_formats,
+    request_binary_format,
+    response_binary_format,
+)
+from .metrics import (
+    current_observer,
+    DECODE,
+    ENCODE,
+    HANDLER,
+    HEADERS,
+    observe_stage,
+    Observer,
+    QUERYSTRING,
+    READ,
+    REQUEST,
+    RESPONSE,
+)
+from .streaming import JSONArrayParser, NDJSONParser
 from .typing import Model, PydanticModel, ResponseReturnValue
 
 QUART_SCHEMA_HEADERS_ATTRIBUTE = "_quart_schema_headers_schema"
 QUART_SCHEMA_REQUEST_ATTRIBUTE = "_quart_schema_request_schema"
 QUART_SCHEMA_RESPONSE_ATTRIBUTE = "_quart_schema_response_schemas"
 QUART_SCHEMA_QUERYSTRING_ATTRIBUTE = "_quart_schema_querystring_schema"
+QUART_SCHEMA_PIPELINE_ATTRIBUTE = "_quart_schema_pipeline"
+QUART_SCHEMA_PYDANTIC_ATTRIBUTE = "_quart_schema_pydantic_dataclass"
 
 
 class SchemaInvalidError(Exception):
@@ -39,6 +105,17 @@ class RequestSchemaValidationError(BadRequest):
         self.validation_error = validation_error
 
 
+class RequestItemValidationError(RequestSchemaValidationError):
+    """An item of a streamed request body is invalid.
+
+    The *index* is the position of the invalid item in the stream.
+    """
+
+    def __init__(self, validation_error: Union[TypeError, ValidationError], index: int) -> None:
+        super().__init__(validation_error)
+        self.index = index
+
+
 class QuerystringValidationError(RequestSchemaValidationError):
     pass
 
@@ -49,7 +126,79 @@ class RequestHeadersValidationError(RequestSchemaValidationError):
 
 class DataSource(Enum):
     FORM = auto()
+    FORM_MULTIPART = auto()
     JSON = auto()
+    JSON_STREAM = auto()
+    NDJSON = auto()
+
+
+FORM_SOURCES = {DataSource.FORM, DataSource.FORM_MULTIPART}
+STREAM_SOURCES = {DataSource.JSON_STREAM, DataSource.NDJSON}
+# The size above which uploaded files are written to disk
+SPOOL_SIZE = 1024 * 1024
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_MIMETYPES = ["application/json", NDJSON_MIMETYPE]
+
+
+class RequestStream:
+    """An async iterator of the validated items of a streamed body.
+
+    The body is parsed as it is received, so that only the items
+    currently being parsed are held in memory. An invalid item raises
+    a `RequestItemValidationError` which, if caught, can be skipped
+    by continuing the iteration. A malformed body raises a
+    `BadRequest`.
+    """
+
+    def __init__(self, model_class: PydanticModel, source: DataSource) -> None:
+        self._model_class = model_class
+        self._request = request._get_current_object()  # type: ignore
+        self._chunks = self._request.body.__aiter__()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._parser = JSONArrayParser() if source == DataSource.JSON_STREAM else NDJSONParser()
+        self._convert_casing = _convert_casing()
+        self._items: Deque[Any] = deque()
+        self._index = 0
+        self._complete = False
+
+    def __aiter__(self) -> RequestStream:
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._items:
+            if self._complete:
+                raise StopAsyncIteration()
+            await self._parse_next_chunk()
+
+        data = self._items.popleft()
+        index = self._index
+        self._index += 1
+        if self._convert_casing:
+            data = decamelize_model_value(data, self._model_class)
+        try:
+            return self._model_class(**data)
+        except (TypeError, ValidationError) as error:
+            raise RequestItemValidationError(error, index)
+
+    async def _parse_next_chunk(self) -> None:
+        try:
+            chunk = await asyncio.wait_for(
+                self._chunks.__anext__(), timeout=self._request.body_timeout
+            )
+        except StopAsyncIteration:
+            chunk = b""
+            self._complete = True
+        except asyncio.TimeoutError:
+            self._complete = True
+            raise RequestTimeout()
+
+        try:
+            text = self._text_decoder.decode(chunk, self._complete)
+            self._items.extend(self._parser.feed(text, self._complete))
+        except ValueError as error:
+            self._complete = True
+            self._request.on_json_loading_failed(error)
+            raise BadRequest()
 
 
 def validate_querystring(model_class: Model) -> Callable:
@@ -64,25 +213,12 @@ def validate_querystring(model_class: Model) -> Callable:
             dataclass or a class that inherits from pydantic's
             BaseModel. All the fields must be optional.
     """
-    model_class = _to_pydantic_model(model_class)
-    schema = model_schema(model_class)
-
-    if len(schema.get("required", [])) != 0:
-        raise SchemaInvalidError("Fields must be optional")
 
     def decorator(func: Callable) -> Callable:
-        setattr(func, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, model_class)
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                model = model_class(**request.args)
-            except (TypeError, ValidationError) as error:
-                raise QuerystringValidationError(error)
-            else:
-                return await current_app.ensure_async(func)(*args, query_args=model, **kwargs)
-
-        return wrapper
+        pipeline = _get_pipeline(func)
+        setattr(pipeline.wrapper, QUART_SCHEMA_QUERYSTRING_ATTRIBUTE, model_class)
+        pipeline.querystring_model_class = model_class
+        return pipeline.wrapper
 
     return decorator
 
@@ -100,21 +236,12 @@ def validate_headers(model_class: Model) -> Callable:
             BaseModel.
 
     """
-    model_class = _to_pydantic_model(model_class)
 
     def decorator(func: Callable) -> Callable:
-        setattr(func, QUART_SCHEMA_HEADERS_ATTRIBUTE, model_class)
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                model = _convert_headers(request.headers, model_class)
-            except (TypeError, ValidationError) as error:
-                raise RequestHeadersValidationError(error)
-            else:
-                return await current_app.ensure_async(func)(*args, headers=model, **kwargs)
-
-        return wrapper
+        pipeline = _get_pipeline(func)
+        setattr(pipeline.wrapper, QUART_SCHEMA_HEADERS_ATTRIBUTE, model_class)
+        pipeline.headers_model_class = model_class
+        return pipeline.wrapper
 
     return decorator
 
@@ -136,34 +263,17 @@ def validate_request(
             dataclass or a class that inherits from pydantic's
             BaseModel. All the fields must be optional.
         source: The source of the data to validate (json or form
-            encoded).
+            encoded). The stream sources (a JSON array or newline
+            delimited JSON) instead pass a `RequestStream` of
+            validated items as the data.
     """
-    model_class = _to_pydantic_model(model_class)
-    schema = model_schema(model_class)
-
-    if source == DataSource.FORM and any(
-        schema["properties"][field]["type"] == "object" for field in schema["properties"]
-    ):
-        raise SchemaInvalidError("Form must not have nested objects")
 
     def decorator(func: Callable) -> Callable:
-        setattr(func, QUART_SCHEMA_REQUEST_ATTRIBUTE, (model_class, source))
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if source == DataSource.JSON:
-                data = await request.get_json()
-            else:
-                data = await request.form
-
-            try:
-                model = model_class(**data)
-            except (TypeError, ValidationError) as error:
-                raise RequestSchemaValidationError(error)
-            else:
-                return await current_app.ensure_async(func)(*args, data=model, **kwargs)
-
-        return wrapper
+        pipeline = _get_pipeline(func)
+        setattr(pipeline.wrapper, QUART_SCHEMA_REQUEST_ATTRIBUTE, (model_class, source))
+        pipeline.request_model_class = model_class
+        pipeline.request_source = source
+        return pipeline.wrapper
 
     return decorator
 
@@ -173,6 +283,8 @@ def validate_response(
     status_code: int = 200,
     headers_model_class: Optional[Model] = None,
     by_alias: bool = False,
+    strict: bool = False,
+    sample_rate: Optional[float] = None,
 ) -> Callable:
     """Validate the response data.
 
@@ -180,8 +292,11 @@ def validate_response(
     body can be converted to the *model_class* or an instance of the
     *model_class*. If this is not possible a
     `ResponseSchemaValidationError` is raised which by default results
-    in a 500 response. The returned value is then a dictionary which
-    Quart encodes as JSON.
+    in a 500 response. The validated value is then encoded as JSON.
+
+    Instances of the *model_class* (including subclasses) have already
+    been validated, and so are not validated again unless *strict* is
+    set.
 
     Arguments:
         model_class: The model to use, either a dataclass, pydantic
@@ -194,75 +309,24 @@ def validate_response(
             that inherits from pydantic's BaseModel. Is optional.
         by_alias: (Only for pydantic Models) Serialize model using
             field aliases instead of field names.
+        strict: Validate instances of the *model_class* again, rather
+            than trusting them.
+        sample_rate: The fraction of responses to validate, defaults
+            to the ``response_sample_rate`` given to QuartSchema. All
+            responses are validated in debug mode.
     """
-    model_class = _to_pydantic_model(model_class)
-    headers_model_class = _to_pydantic_model(headers_model_class)
 
     def decorator(
-        func: Callable[..., ResponseReturnValue]
+        func: Callable[..., ResponseReturnValue],
     ) -> Callable[..., QuartResponseReturnValue]:
-        schemas = getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {})
+        schemas = dict(getattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, {}))
         schemas[status_code] = (model_class, headers_model_class)
-        setattr(func, QUART_SCHEMA_RESPONSE_ATTRIBUTE, schemas)
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            result = await current_app.ensure_async(func)(*args, **kwargs)
-
-            status_or_headers = None
-            headers = None
-            if isinstance(result, tuple):
-                value, status_or_headers, headers = result + (None,) * (3 - len(result))
-            else:
-                value = result
-
-            status = 200
-            if isinstance(status_or_headers, int):
-                status = int(status_or_headers)
-
-            if status == status_code:
-                try:
-                    if isinstance(value, dict):
-                        model_value = model_class(**value)
-                    elif type(value) == model_class:
-                        model_value = value
-                    elif is_dataclass(value):
-                        model_value = model_class(**asdict(value))
-                    else:
-                        raise ResponseSchemaValidationError()
-                except ValidationError as error:
-                    raise ResponseSchemaValidationError(error)
-
-                if is_dataclass(model_value):
-                    return_value = asdict(model_value)
-                else:
-                    return_value = cast(BaseModel, model_value).dict(by_alias=by_alias)
-
-                if headers_model_class is not None:
-                    try:
-                        if isinstance(headers, dict):
-                            headers_model_value = _convert_headers(headers, headers_model_class)
-                        elif type(value) == headers_model_class:
-                            headers_model_value = headers
-                        elif is_dataclass(headers):
-                            headers_model_value = headers_model_class(**asdict(headers))
-                        else:
-                            raise ResponseHeadersValidationError()
-                    except ValidationError as error:
-                        raise ResponseHeadersValidationError(error)
-
-                    if is_dataclass(headers_model_value):
-                        headers_value = asdict(headers_model_value)
-                    else:
-                        headers_value = cast(BaseModel, headers_model_value).dict()
-                else:
-                    headers_value = headers
-
-                return return_value, status, headers_value
-            else:
-                return result
-
-        return wrapper
+        pipeline = _get_pipeline(func)
+        setattr(pipeline.wrapper, QUART_SCHEMA_RESPONSE_ATTRIBUTE, schemas)
+        pipeline.responses[status_code] = _ResponseValidation(
+            model_class, headers_model_class, by_alias, strict, sample_rate
+        )
+        return pipeline.wrapper
 
     return decorator
 
@@ -290,31 +354,755 @@ def validate(
         if headers is not None:
             func = validate_headers(headers)(func)
         for status, models in responses.items():
-            func = validate_response(models[0], status, models[1])
+            func = validate_response(models[0], status, models[1])(func)
         return func
 
     return decorator
 
 
+class _QuerystringParser:
+    """Extracts a querystring model's values from the query args.
+
+    How each field's value is extracted, and for simple models
+    converted, is decided once when the decorator is applied. List
+    fields receive all the values of repeated args. Models whose
+    fields are all simple (str, int, float, or bool) without
+    validators are constructed from the converted values directly,
+    falling back to pydantic's validation for the error if a value
+    fails to convert or a required field is missing.
+    """
+
+    def __init__(self, model_class: PydanticModel) -> None:
+        self.model_class = model_class
+        model = get_model(model_class)
+        config = model.__config__
+        use_alias = lenient_issubclass(model_class, BaseModel)
+        self.extra = config.extra != Extra.ignore
+        self.fast = use_alias and not (
+            self.extra or model.__pre_root_validators__ or model.__post_root_validators__
+        )
+        self.fields: List[Tuple[Tuple[str, ...], str, bool, Optional[Callable]]] = []
+        self.required: Set[str] = set()
+        for field in model.__fields__.values():
+            argument = field.alias if use_alias else field.name
+            names: Tuple[str, ...] = (argument,)
+            if config.allow_population_by_field_name and field.name != argument:
+                names = (argument, field.name)
+            convert = _simple_converter(field, config)
+            self.fast = self.fast and convert is not None
+            self.fields.append((names, argument, field.shape == SHAPE_LIST, convert))
+            if field.required:
+                self.required.add(argument)
+
+    def parse(self, args: MultiDict) -> Any:
+        values: Dict[str, Any] = {}
+        converted: Dict[str, Any] = {}
+        for names, argument, many, convert in self.fields:
+            for name in names:
+                if name in args:
+                    value = args.getlist(name) if many else args[name]
+                    values[argument] = value
+                    if self.fast:
+                        try:
+                            if many:
+                                converted[argument] = [convert(item) for item in value]
+                            else:
+                                converted[argument] = convert(value)
+                        except ValueError:
+                            pass  # Left for pydantic to report the error
+                    break
+
+        if self.extra:
+            known = {name for names, *_ in self.fields for name in names}
+            for key in args.keys():
+                if key not in known:
+                    values[key] = args[key]
+
+        if self.fast and len(converted) == len(values) and self.required.issubset(converted):
+            return self.model_class.construct(**converted)  # type: ignore
+        else:
+            return self.model_class(**values)
+
+
+def _simple_converter(field: ModelField, config: Type[BaseConfig]) -> Optional[Callable]:
+    if field.class_validators or field.shape not in {SHAPE_SINGLETON, SHAPE_LIST}:
+        return None
+    elif field.type_ is str and not (
+        config.anystr_strip_whitespace
+        or config.anystr_lower
+        or config.anystr_upper
+        or config.min_anystr_length
+        or config.max_anystr_length is not None
+    ):
+        return str
+    elif field.type_ is int:
+        return int
+    elif field.type_ is float and config.allow_inf_nan:
+        return float
+    elif field.type_ is bool:
+        return _convert_bool
+    else:
+        return None
+
+
+def _convert_bool(value: str) -> bool:
+    value = value.lower()
+    if value in BOOL_TRUE:
+        return True
+    elif value in BOOL_FALSE:
+        return False
+    else:
+        raise ValueError()
+
+
+class _ResponseValidation:
+    def __init__(
+        self,
+        model_class: Model,
+        headers_model_class: Optional[Model],
+        by_alias: bool,
+        strict: bool,
+        sample_rate: Optional[float],
+    ) -> None:
+        self.model_class = model_class
+        self.headers_model_class = headers_model_class
+        self.by_alias = by_alias
+        self.strict = strict
+        self.sample_rate = sample_rate
+
+    def prepare(self) -> None:
+        self.model_class = _to_pydantic_model(self.model_class)
+        self.headers_model_class = _to_pydantic_model(self.headers_model_class)
+        if self.headers_model_class is not None:
+            _header_names(self.headers_model_class)
+
+    async def validate(self, value: Any, status: int, headers: Any) -> Any:
+        rate = _response_sample_rate(self.sample_rate)
+        validate = rate >= 1 or random() < rate
+        if isasyncgen(value):
+            return_value = await _stream_response_values(
+                value, self.model_class, self.by_alias, self.strict, validate, rate < 1
+            )
+        else:
+            return_value = await _response_value(
+                value, self.model_class, self.by_alias, self.strict, validate, rate < 1
+            )
+            if binary_formats() and (
+                isinstance(return_value, (dict, list, BaseModel)) or is_dataclass(return_value)
+            ):
+                binary_format = response_binary_format()
+                if binary_format is not None:
+                    return_value = current_app.response_class(
+                        binary_format.dumps(return_value, _convert_casing()),
+                        mimetype=binary_format.mimetype,
+                    )
+                else:
+                    return_value = current_app.json.response(return_value)
+                # The representation depends on the Accept header, even
+                # when JSON is chosen, so caches must key on it.
+                return_value.vary.add("Accept")
+
+        headers_model_class = self.headers_model_class
+        if headers_model_class is not None:
+            try:
+                if isinstance(headers, dict):
+                    headers_model_value = _convert_headers(headers, headers_model_class)
+                elif is_dataclass(headers):
+                    headers_model_value = headers_model_class(**asdict(headers))
+                elif isinstance(headers, headers_model_class):
+                    headers_model_value = headers
+                else:
+                    raise ResponseHeadersValidationError()
+            except TypeError:  # Missing arguments
+                raise ResponseHeadersValidationError()
+            except ValidationError as error:
+                raise ResponseHeadersValidationError(error)
+
+            if is_dataclass(headers_model_value):
+                headers_value = asdict(headers_model_value)
+            else:
+                headers_value = cast(BaseModel, headers_model_value).dict()
+        else:
+            headers_value = headers
+
+        return return_value, status, headers_value
+
+
+class _Pipeline:
+    """The validation of a route, whichever decorators are used.
+
+    The validation decorators add to a single pipeline, rather than
+    each wrapping the route in turn, so that a request is validated
+    in one call. The cheap header and querystring checks run before
+    the body is read, and the response validation is looked up by
+    status code.
+
+    The decorators only record the models, which are converted and
+    checked when the pipeline is prepared, either for all routes
+    before the app serves or on first use, so as not to slow imports.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        self.is_async = asyncio.iscoroutinefunction(func)
+        self.prepared = False
+        self.headers_model_class: Optional[Model] = None
+        self.querystring_model_class: Optional[Model] = None
+        self.querystring_parser: Optional[_QuerystringParser] = None
+        self.request_model_class: Optional[Model] = None
+        self.request_source = DataSource.JSON
+        self.responses: Dict[int, _ResponseValidation] = {}
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self.handle(args, kwargs)
+
+        setattr(wrapper, QUART_SCHEMA_PIPELINE_ATTRIBUTE, self)
+        self.wrapper = wrapper
+
+    def copy(self) -> _Pipeline:
+        pipeline = _Pipeline(self.func)
+        pipeline.headers_model_class = self.headers_model_class
+        pipeline.querystring_model_class = self.querystring_model_class
+        pipeline.request_model_class = self.request_model_class
+        pipeline.request_source = self.request_source
+        pipeline.responses = dict(self.responses)
+        for name, value in vars(self.wrapper).items():
+            if name != QUART_SCHEMA_PIPELINE_ATTRIBUTE:
+                setattr(pipeline.wrapper, name, value)
+        return pipeline
+
+    def prepare(self, check_schemas: bool = True) -> None:
+        """Convert the models and, if *check_schemas*, check they are usable."""
+        if self.prepared:
+            return
+
+        inner = getattr(self.func, QUART_SCHEMA_PIPELINE_ATTRIBUTE, None)
+        if inner is not None:
+            inner.prepare(check_schemas)
+
+        self.headers_model_class = _to_pydantic_model(self.headers_model_class)
+        if self.headers_model_class is not None:
+            _header_names(self.headers_model_class)
+        if self.querystring_model_class is not None:
+            model_class = _to_pydantic_model(self.querystring_model_class)
+            if check_schemas:
+                _check_querystring_model(model_class)
+            self.querystring_parser = _QuerystringParser(model_class)
+        self.request_model_class = _to_pydantic_model(self.request_model_class)
+        if self.request_model_class is not None and check_schemas:
+            _check_request_model(self.request_model_class, self.request_source)
+        for validation in self.responses.values():
+            validation.prepare()
+        self.prepared = True
+
+    async def handle(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        if not self.prepared:
+            self.prepare(_check_schemas())
+
+        observer = current_observer()
+        endpoint = request.endpoint
+        if self.headers_model_class is not None:
+            with observe_stage(observer, endpoint, HEADERS, self.headers_model_class):
+                try:
+                    kwargs["headers"] = _convert_headers(request.headers, self.headers_model_class)
+                except (TypeError, ValidationError) as error:
+                    raise RequestHeadersValidationError(error)
+
+        if self.querystring_parser is not None:
+            model_class = self.querystring_parser.model_class
+            with observe_stage(observer, endpoint, QUERYSTRING, model_class):
+                try:
+                    kwargs["query_args"] = self.querystring_parser.parse(request.args)
+                except (TypeError, ValidationError) as error:
+                    raise QuerystringValidationError(error)
+
+        if self.request_model_class is not None:
+            kwargs["data"] = await _get_request_model(
+                self.request_model_class, self.request_source, observer, endpoint
+            )
+
+        with observe_stage(observer, endpoint, HANDLER):
+            if self.is_async:
+                result = await self.func(*args, **kwargs)
+            else:
+                result = await current_app.ensure_async(self.func)(*args, **kwargs)
+
+        if not self.responses:
+            return result
+
+        status_or_headers = None
+        headers = None
+        if isinstance(result, tuple):
+            value, status_or_headers, headers = result + (None,) * (3 - len(result))
+        else:
+            value = result
+
+        status = 200
+        if isinstance(status_or_headers, int):
+            status = int(status_or_headers)
+
+        validation = self.responses.get(status)
+        if validation is None:
+            return result
+        else:
+            with observe_stage(observer, endpoint, RESPONSE, validation.model_class):
+                value, status, headers = await validation.validate(value, status, headers)
+            if observer is not None and isinstance(value, (dict, list)):
+                # Encoded here, as convert_model_result only observes the
+                # encoding of model instances.
+                with observe_stage(observer, endpoint, ENCODE, validation.model_class):
+                    value = current_app.json.response(value)
+            return value, status, headers
+
+
+def prepare_route(func: Callable, check_schemas: bool = True) -> None:
+    """Prepare the validation of the route, if it is validated."""
+    pipeline = getattr(func, QUART_SCHEMA_PIPELINE_ATTRIBUTE, None)
+    if pipeline is not None:
+        pipeline.prepare(check_schemas)
+
+
+def _check_querystring_model(model_class: PydanticModel) -> None:
+    schema = model_schema(model_class)
+    if len(schema.get("required", [])) != 0:
+        raise SchemaInvalidError("Fields must be optional")
+
+
+def _check_request_model(model_class: PydanticModel, source: DataSource) -> None:
+    if source not in FORM_SOURCES:
+        return
+
+    if _is_bulk_model(model_class):
+        raise SchemaInvalidError("Form must be an object")
+
+    schema = model_schema(model_class)
+    if any(schema["properties"][field]["type"] == "object" for field in schema["properties"]):
+        raise SchemaInvalidError("Form must not have nested objects")
+
+
+def _get_pipeline(func: Callable) -> _Pipeline:
+    # The pipeline attribute is copied to any decorators that wrap
+    # the pipeline's wrapper, hence the check that func is the wrapper.
+    pipeline = getattr(func, QUART_SCHEMA_PIPELINE_ATTRIBUTE, None)
+    if pipeline is None or pipeline.wrapper is not func:
+        return _Pipeline(func)
+    else:
+        # Copied, as the wrapper may already be registered as a route
+        # which must not gain the further validation.
+        return pipeline.copy()
+
+
+async def _get_request_model(
+    model_class: PydanticModel,
+    source: DataSource,
+    observer: Optional[Observer] = None,
+    endpoint: Optional[str] = None,
+) -> Any:
+    if source in STREAM_SOURCES:
+        return RequestStream(model_class, source)
+    elif source == DataSource.JSON:
+        with observe_stage(observer, endpoint, READ, model_class):
+            body = await request.get_data(cache=True, as_text=False, parse_form_data=False)
+        size = len(body)
+        binary_format = request_binary_format()
+        with observe_stage(observer, endpoint, DECODE, model_class):
+            if binary_format is None:
+                data = await _offload(size, _decode_json, body, model_class)
+            else:
+                data = await _offload(size, _decode_binary, body, model_class, binary_format)
+    elif source == DataSource.FORM_MULTIPART:
+        size = 0
+        with observe_stage(observer, endpoint, READ, model_class):
+            data = await _get_multipart(model_class)
+    else:
+        size = 0
+        with observe_stage(observer, endpoint, READ, model_class):
+            data = await request.form
+
+    with observe_stage(observer, endpoint, REQUEST, model_class):
+        return await _offload(size, _build_request_model, data, model_class)
+
+
+def _build_request_model(data: Any, model_class: PydanticModel) -> Any:
+    try:
+        if _is_bulk_model(model_class):
+            return model_class(__root__=data).__root__  # type: ignore
+        else:
+            return model_class(**data)
+    except (TypeError, ValidationError) as error:
+        raise RequestSchemaValidationError(error)
+
+
+async def _get_multipart(model_class: PydanticModel) -> Dict[str, Any]:
+    mimetype, options = parse_options_header(request.headers.get("Content-Type", ""))
+    if mimetype != "multipart/form-data" or "boundary" not in options:
+        return {}
+
+    data: Dict[str, Any] = {}
+    containers: List[IO[bytes]] = []
+    try:
+        boundary = options["boundary"].encode("latin-1")
+        await _MultipartReader(model_class, boundary, data, containers).read()
+    except Exception as error:
+        for container in containers:
+            container.close()
+        if isinstance(error, ValueError):  # Malformed body
+            raise BadRequest()
+        raise
+    return data
+
+
+class _MultipartReader:
+    """Parses a multipart body as it is received.
+
+    File parts are written to spooled temporary files and text fields
+    are validated as soon as they are complete, so that an invalid
+    form fails before any later files are received.
+    """
+
+    def __init__(
+        self,
+        model_class: PydanticModel,
+        boundary: bytes,
+        data: Dict[str, Any],
+        containers: List[IO[bytes]],
+    ) -> None:
+        self.model = get_model(model_class)
+        self.fields = {field.alias: field for field in self.model.__fields__.values()}
+        self.decoder = MultipartDecoder(boundary)
+        self.data = data
+        self.containers = containers
+        self.part: Union[MultipartField, MultipartFile, None] = None
+        self.field: Optional[ModelField] = None
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    async def read(self) -> None:
+        async for chunk in request.body:
+            self.decoder.receive_data(chunk)
+            self._process_events()
+        self.decoder.receive_data(None)
+        self._process_events()  # Raises a ValueError if incomplete
+
+    def _process_events(self) -> None:
+        event = self.decoder.next_event()
+        while not isinstance(event, (Epilogue, NeedData)):
+            if isinstance(event, (MultipartField, MultipartFile)):
+                self.part = event
+                self.field = self.fields.get(event.name)
+                self.size = 0
+                if self.field is None:
+                    pass  # Not in the model, so its data is discarded
+                elif isinstance(event, MultipartFile):
+                    self.containers.append(SpooledTemporaryFile(max_size=SPOOL_SIZE))
+                else:
+                    self.chunks = []
+            elif isinstance(event, Data) and self.part is not None and self.field is not None:
+                self._receive_data(event, self.part, self.field)
+            event = self.decoder.next_event()
+
+    def _receive_data(
+        self, event: Data, part: Union[MultipartField, MultipartFile], field: ModelField
+    ) -> None:
+        self.size += len(event.data)
+        max_size = field.field_info.extra.get("max_size")
+        if max_size is not None and self.size > max_size:
+            raise RequestEntityTooLarge()
+
+        value: Any
+        if isinstance(part, MultipartFile):
+            container = self.containers[-1]
+            container.write(event.data)
+            if not event.more_data:
+                container.seek(0)
+                value = FileStorage(container, part.filename, part.name, headers=part.headers)
+                _add_form_value(self.data, field, part.name, value)
+        else:
+            self.chunks.append(event.data)
+            if not event.more_data:
+                value = b"".join(self.chunks).decode()
+                _validate_form_field(self.model, field, value)
+                _add_form_value(self.data, field, part.name, value)
+
+
+def _validate_form_field(model: Type[BaseModel], field: ModelField, value: str) -> None:
+    # Fields with validators are left to the model, as the validators
+    # may use the other fields' values.
+    if field.shape != SHAPE_SINGLETON or field.class_validators:
+        return
+
+    _, errors = field.validate(value, {}, loc=field.alias, cls=model)
+    if errors is not None:
+        raise RequestSchemaValidationError(ValidationError([errors], model))
+
+
+def _add_form_value(data: Dict[str, Any], field: ModelField, name: str, value: Any) -> None:
+    if field.shape == SHAPE_SINGLETON:
+        data.setdefault(name, value)
+    else:
+        data.setdefault(name, []).append(value)
+
+
 T = TypeVar("T")
 
 
 def _convert_headers(headers: Union[dict, Headers], model_class: Type[T]) -> T:
+    header_names = _header_names(model_class)
     result = {}
-    for raw_key in headers.keys():
-        key = raw_key.replace("-", "_").lower()
-        if key in model_class.__annotations__:
-            if isinstance(headers, Headers):
-                result[key] = ",".join(headers.get_all(raw_key))
-            else:
-                result[key] = headers[raw_key]
+    if isinstance(headers, Headers):
+        # Only the wanted headers are fetched, rather than checking
+        # every header present.
+        for name, argument in header_names.items():
+            values = headers.getlist(name)
+            if values:
+                result[argument] = ",".join(values)
+    else:
+        for raw_key, value in headers.items():
+            argument = header_names.get(raw_key.replace("_", "-").lower())
+            if argument is not None:
+                result[argument] = value
     return model_class(**result)
 
 
+_header_names_cache: WeakKeyDictionary[type, Dict[str, str]] = WeakKeyDictionary()
+
+
+def _header_names(model_class: Any) -> Dict[str, str]:
+    # Maps the lowercased header names to the model's arguments, for
+    # all the fields including inherited fields and aliases.
+    model = get_model(model_class)
+    try:
+        return _header_names_cache[model]
+    except KeyError:
+        pass
+
+    use_alias = lenient_issubclass(model_class, BaseModel)
+    header_names = {}
+    for field in model.__fields__.values():
+        argument = field.alias if use_alias else field.name
+        for name in {field.name, field.alias}:
+            header_names[name.replace("_", "-").lower()] = argument
+    _header_names_cache[model] = header_names
+    return header_names
+
+
+def _check_schemas() -> bool:
+    extension = current_app.extensions.get("QUART_SCHEMA")
+    return extension is None or extension.check_schemas
+
+
+def _convert_casing() -> bool:
+    extension = current_app.extensions.get("QUART_SCHEMA")
+    return extension is not None and extension.convert_casing
+
+
+async def _offload(size: int, func: Callable[..., T], *args: Any) -> T:
+    # Payloads of at least the extension's offload threshold are
+    # decoded and validated in its pool, so that they don't block the
+    # event loop, whereas smaller payloads are quicker inline.
+    extension = current_app.extensions.get("QUART_SCHEMA")
+    if extension is None or extension.offload_threshold is None:
+        return func(*args)
+    elif size < extension.offload_threshold:
+        return func(*args)
+    else:
+        return await extension.offload(func, *args)
+
+
+def _decode_json(body: bytes, model_class: PydanticModel) -> Any:
+    if not request.is_json:
+        return None
+
+    convert_casing = _convert_casing()
+    try:
+        if convert_casing:
+            # Only the keys the model defines are converted, rather
+            # than all the keys as the JSON provider would.
+            data = current_app.json.loads(body, convert_casing=False)
+        else:
+            data = current_app.json.loads(body)
+    except ValueError as error:
+        data = request.on_json_loading_failed(error)
+    if convert_casing:
+        data = decamelize_model_value(data, model_class)
+    return data
+
+
+def _decode_binary(body: bytes, model_class: PydanticModel, binary_format: BinaryFormat) -> Any:
+    try:
+        data = binary_format.loads(body)
+    except ValueError:
+        raise BadRequest()
+    if _convert_casing():
+        data = decamelize_model_value(data, model_class)
+    return data
+
+
+async def _response_value(
+    value: Any,
+    model_class: PydanticModel,
+    by_alias: bool,
+    strict: bool,
+    validate: bool,
+    sampled: bool,
+) -> Any:
+    if validate:
+        try:
+            model_value = _validate_response_value(value, model_class, strict)
+        except ResponseSchemaValidationError as error:
+            if not sampled:
+                raise
+            await current_app.extensions["QUART_SCHEMA"].report_response_failure(error)
+            return _camelize_result(value, model_class)
+    elif _is_bulk_model(model_class):
+        model_value = model_class.construct(__root__=value)  # type: ignore
+    elif isinstance(value, model_class):
+        model_value = value
+    else:
+        # Unvalidated values are cased as validated values would be,
+        # rather than converting free-form fields' keys.
+        return _camelize_result(value, model_class)
+
+    result = _model_value_to_result(model_value, model_class, by_alias)
+    return _camelize_result(result, model_class)
+
+
+def _camelize_result(result: Any, model_class: PydanticModel) -> Any:
+    if isinstance(result, (dict, list)) and _convert_casing():
+        result = camelize_model_value(result, model_class)
+    return result
+
+
+async def _stream_response_values(
+    values: AsyncGenerator[Any, None],
+    model_class: PydanticModel,
+    by_alias: bool,
+    strict: bool,
+    validate: bool,
+    sampled: bool,
+) -> Response:
+    ndjson = request.accept_mimetypes.best_match(STREAM_MIMETYPES) == NDJSON_MIMETYPE
+
+    async def encode(value: Any) -> bytes:
+        result = await _response_value(value, model_class, by_alias, strict, validate, sampled)
+        return current_app.json.dumps(result, separators=(",", ":")).encode()
+
+    # The first value is encoded before the response starts, so that
+    # it can still be an error response if the value is invalid.
+    try:
+        first = await encode(await values.__anext__())
+    except StopAsyncIteration:
+        first = None
+
+    @stream_with_context
+    async def body() -> AsyncGenerator[bytes, None]:
+        if ndjson:
+            if first is not None:
+                yield first + b"\n"
+            async for value in values:
+                yield await encode(value) + b"\n"
+        elif first is None:
+            yield b"[]"
+        else:
+            yield b"[" + first
+            async for value in values:
+                yield b"," + await encode(value)
+            yield b"]"
+
+    mimetype = NDJSON_MIMETYPE if ndjson else "application/json"
+    return current_app.response_class(body(), mimetype=mimetype)
+
+
+def _validate_response_value(value: Any, model_class: PydanticModel, strict: bool) -> Any:
+    try:
+        if _is_bulk_model(model_class):
+            return model_class(__root__=value)
+        elif isinstance(value, dict):
+            return model_class(**value)
+        elif isinstance(value, model_class) and not strict:
+            if is_dataclass(value):
+                # Validates plain dataclass instances in place, and
+                # does nothing if already validated.
+                value.__pydantic_validate_values__()  # type: ignore
+            return value
+        elif isinstance(value, BaseModel):
+            return model_class(**value.dict())
+        elif is_dataclass(value):
+            return model_class(**asdict(value))
+        else:
+            raise ResponseSchemaValidationError()
+    except ValidationError as error:
+        raise ResponseSchemaValidationError(error)
+
+
+def _response_sample_rate(sample_rate: Optional[float]) -> float:
+    if current_app.debug or "QUART_SCHEMA" not in current_app.extensions:
+        return 1.0
+    elif sample_rate is None:
+        return current_app.extensions["QUART_SCHEMA"].response_sample_rate
+    else:
+        return sample_rate
+
+
+def _model_value_to_result(
+    model_value: Any, model_class: PydanticModel, by_alias: bool
+) -> Union[Any, dict]:
+    # Instances of the model_class itself are left for the JSON
+    # provider to encode, whereas subclasses are reduced to the
+    # model_class's fields.
+    if _is_bulk_model(model_class):
+        return model_value.dict(by_alias=by_alias)["__root__"]
+    elif type(model_value) is getattr(model_class, "__dataclass__", model_class):
+        if by_alias and isinstance(model_value, BaseModel):
+            return model_value.dict(by_alias=True)
+        else:
+            return model_value
+    elif is_dataclass(model_value):
+        fields = model_class.__dataclass_fields__  # type: ignore
+        return {key: value for key, value in asdict(model_value).items() if key in fields}
+    else:
+        return cast(BaseModel, model_value).dict(
+            by_alias=by_alias, include=set(model_class.__fields__)  # type: ignore
+        )
+
+
+class _BulkModel(BaseModel):
+    # The base of the models created to validate List[Model] and
+    # Dict[str, Model] values in a single call.
+    __root__: Any
+
+
+@lru_cache(maxsize=None)
+def _bulk_model(type_: Any) -> Type[_BulkModel]:
+    return create_model(display_as_type(type_), __base__=_BulkModel, __root__=(type_, ...))
+
+
+def _is_bulk_model(model_class: Any) -> bool:
+    return lenient_issubclass(model_class, _BulkModel)
+
+
 def _to_pydantic_model(model_class: Model) -> PydanticModel:
     pydantic_model_class: PydanticModel
     if is_dataclass(model_class):
-        pydantic_model_class = pydantic_dataclass(model_class)  # type: ignore
+        pydantic_model_class = _pydantic_dataclass(model_class)
+    elif get_origin(model_class) in {list, dict}:
+        pydantic_model_class = _bulk_model(cast(Hashable, model_class))
     else:
         pydantic_model_class = cast(PydanticModel, model_class)
     return pydantic_model_class
+
+
+def _pydantic_dataclass(model_class: Any) -> PydanticModel:
+    # Converted once per dataclass, so that all the routes share the
+    # validators and the openapi definitions, with the conversion kept
+    # on the dataclass itself as the converted proxy refers to the
+    # dataclass and cannot be weakly referenced. The conversion is then
+    # freed along with the dataclass.
+    dataclass = getattr(model_class, "__dataclass__", model_class)
+    try:
+        return vars(dataclass)[QUART_SCHEMA_PYDANTIC_ATTRIBUTE]
+    except KeyError:
+        pydantic_model_class: PydanticModel = pydantic_dataclass(dataclass)  # type: ignore
+        setattr(dataclass, QUART_SCHEMA_PYDANTIC_ATTRIBUTE, pydantic_model_class)
+        return pydantic_model_class
@@ -1,12 +1,23 @@
+import gzip
 from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
 from typing import Optional
+from uuid import UUID
 
 import pytest
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass as pydantic_dataclass
-from quart import Quart
+from quart import Quart, request
 
-from quart_schema import QuartSchema, ResponseReturnValue
+from quart_schema import (
+    disable_compression,
+    QuartSchema,
+    ResponseReturnValue,
+    validate_request,
+    validate_response,
+)
+from quart_schema.metrics import MetricsCollector
 from quart_schema.typing import PydanticModel
 
 
@@ -39,3 +50,144 @@ async def test_make_response(type_: PydanticModel) -> None:
     test_client = app.test_client()
     response = await test_client.get("/")
     assert (await response.get_json()) == {"name": "bob", "age": 2}
+
+
+@dataclass
+class Event:
+    id: UUID
+    when: datetime
+    cost: Decimal
+    details: Details
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+async def test_json_backend(json_backend: str) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, json_backend=json_backend)
+
+    event = Event(
+        id=UUID("0b7bc3fa-0c5e-4d8b-9a0d-2e1fa0a6c4e5"),
+        when=datetime(2022, 1, 2, 3, 4, 5),
+        cost=Decimal("1.5"),
+        details=Details(name="bob", age=2),
+    )
+
+    @app.route("/", methods=["POST"])
+    async def index() -> ResponseReturnValue:
+        assert (await request.get_json()) == {"name": "bob"}
+        return event
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"name": "bob"})
+    if json_backend == "json":
+        # Quart's default encoding
+        cost, when = "1.5", "Sun, 02 Jan 2022 03:04:05 GMT"
+    else:
+        cost, when = 1.5, "2022-01-02T03:04:05"
+    assert (await response.get_json()) == {
+        "cost": cost,
+        "details": {"age": 2, "name": "bob"},
+        "id": "0b7bc3fa-0c5e-4d8b-9a0d-2e1fa0a6c4e5",
+        "when": when,
+    }
+
+
+async def test_metrics() -> None:
+    app = Quart(__name__)
+    metrics = MetricsCollector()
+    QuartSchema(app, observer=metrics)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Details)
+    @validate_response(Details)
+    async def index(data: Details) -> Details:
+        return data
+
+    test_client = app.test_client()
+    await test_client.post("/", json={"name": "bob"})
+    await test_client.post("/", json={"age": 2})
+
+    exported = {(item["stage"], item["model"]): item for item in metrics.export()}
+    assert set(exported) == {
+        ("read", "test_basic.Details"),
+        ("decode", "test_basic.Details"),
+        ("request", "test_basic.Details"),
+        ("handler", None),
+        ("response", "test_basic.Details"),
+        ("encode", "test_basic.Details"),
+    }
+    assert exported[("request", "test_basic.Details")]["count"] == 2
+    assert exported[("request", "test_basic.Details")]["failures"] == 1
+    assert exported[("handler", None)]["buckets"]["inf"] == 1
+    assert all(item["endpoint"] == "index" for item in exported.values())
+
+
+async def test_metrics_dict_response() -> None:
+    app = Quart(__name__)
+    metrics = MetricsCollector()
+    QuartSchema(app, observer=metrics)
+
+    class Details(BaseModel):  # Same name as the module's Details
+        name: str
+
+    @app.route("/")
+    @validate_response(Details)
+    async def index() -> ResponseReturnValue:
+        return {"name": "bob"}
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert (await response.get_json()) == {"name": "bob"}
+
+    model = "test_basic.test_metrics_dict_response.<locals>.Details"
+    exported = {(item["stage"], item["model"]) for item in metrics.export()}
+    assert exported == {("handler", None), ("response", model), ("encode", model)}
+
+
+@pytest.mark.parametrize(
+    "path, accept_encoding, compressed",
+    [
+        ("/large", "gzip, deflate", True),
+        ("/large", "identity", False),
+        ("/small", "gzip", False),
+        ("/uncompressed", "gzip", False),
+        ("/unvalidated", "gzip", False),
+    ],
+)
+async def test_compression(path: str, accept_encoding: str, compressed: bool) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, compression=True, compression_threshold=100)
+
+    @dataclass
+    class Names:
+        names: list
+
+    @app.route("/large")
+    @validate_response(Names)
+    async def large() -> Names:
+        return Names(names=["bob"] * 100)
+
+    @app.route("/small")
+    @validate_response(Names)
+    async def small() -> Names:
+        return Names(names=["bob"])
+
+    @app.route("/uncompressed")
+    @validate_response(Names)
+    @disable_compression
+    async def uncompressed() -> Names:
+        return Names(names=["bob"] * 100)
+
+    @app.route("/unvalidated")
+    async def unvalidated() -> dict:
+        return {"names": ["bob"] * 100}
+
+    test_client = app.test_client()
+    response = await test_client.get(path, headers={"Accept-Encoding": accept_encoding})
+    data = await response.get_data(as_text=False)
+    if compressed:
+        assert response.headers["Content-Encoding"] == "gzip"
+        data = gzip.decompress(data)
+    else:
+        assert "Content-Encoding" not in response.headers
+    assert data.count(b"bob") == (1 if path == "/small" else 100)
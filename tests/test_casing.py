@@ -1,7 +1,8 @@
 from dataclasses import asdict, dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from quart import Quart
+import pytest
+from quart import Quart, request
 
 from quart_schema import (
     QuartSchema,
@@ -10,6 +11,7 @@ from quart_schema import (
     validate_request,
     validate_response,
 )
+from quart_schema.casing import camelize, decamelize
 
 
 @dataclass
@@ -17,9 +19,10 @@ class Data:
     snake_case: str
 
 
-async def test_request_casing() -> None:
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+async def test_request_casing(json_backend: str) -> None:
     app = Quart(__name__)
-    QuartSchema(app, convert_casing=True)
+    QuartSchema(app, convert_casing=True, json_backend=json_backend)
 
     @app.route("/", methods=["POST"])
     @validate_request(Data)
@@ -31,9 +34,10 @@ async def test_request_casing() -> None:
     assert await response.get_data(as_text=True) == "{'snake_case': 'Hello'}"
 
 
-async def test_response_casing() -> None:
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+async def test_response_casing(json_backend: str) -> None:
     app = Quart(__name__)
-    QuartSchema(app, convert_casing=True)
+    QuartSchema(app, convert_casing=True, json_backend=json_backend)
 
     @app.route("/", methods=["GET"])
     @validate_response(Data)
@@ -64,3 +68,120 @@ async def test_querystring_casing() -> None:
     assert await response.get_data(as_text=True) == "{'snake_case': 'Hello'}"
     response = await test_client.get("/?snakeCase=Hello")
     assert await response.get_data(as_text=True) == "{'snake_case': 'Hello'}"
+
+
+async def test_querystring_casing_multi() -> None:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=True)
+
+    @app.get("/")
+    async def index() -> ResponseReturnValue:
+        assert request.args is request.args
+        return {"values": request.args.getlist("snake_case")}
+
+    test_client = app.test_client()
+    response = await test_client.get("/?snakeCase=a&snakeCase=b")
+    assert await response.get_json() == {"values": ["a", "b"]}
+
+
+def test_convert_keys() -> None:
+    value = {"snake_case": [{"nested_key": {"deep_key": 1}}], 2: "two"}
+    camelized = camelize(value)
+    assert camelized == {"snakeCase": [{"nestedKey": {"deepKey": 1}}], 2: "two"}
+    assert decamelize(camelized) == value
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+async def test_nested_request_casing(json_backend: str) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=True, json_backend=json_backend)
+
+    @app.route("/", methods=["POST"])
+    async def index() -> ResponseReturnValue:
+        return str(await request.get_json())
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"outerKey": [{"innerKey": {"deepKey": 1}}]})
+    assert (
+        await response.get_data(as_text=True)
+    ) == "{'outer_key': [{'inner_key': {'deep_key': 1}}]}"
+
+
+@dataclass
+class Details:
+    first_name: str
+
+
+@dataclass
+class Record:
+    record_details: List[Details]
+    free_form: Dict[str, Any]
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+async def test_model_casing(json_backend: str) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=True, json_backend=json_backend)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Record)
+    @validate_response(Record)
+    async def index(data: Record) -> ResponseReturnValue:
+        assert data.free_form == {"someKey": {"otherKey": 1}}
+        return data
+
+    json = {"recordDetails": [{"firstName": "bob"}], "freeForm": {"someKey": {"otherKey": 1}}}
+    test_client = app.test_client()
+    response = await test_client.post("/", json=json)
+    assert response.status_code == 200
+    assert (await response.get_json()) == json
+
+
+@pytest.mark.parametrize("response_sample_rate", [0.0, 1.0])
+async def test_sampled_response_casing(response_sample_rate: float) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=True, response_sample_rate=response_sample_rate)
+
+    @app.route("/")
+    @validate_response(Record)
+    async def index() -> ResponseReturnValue:
+        return {"record_details": [{"first_name": "bob"}], "free_form": {"a_b": 1}}
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert (await response.get_json()) == {
+        "recordDetails": [{"firstName": "bob"}],
+        "freeForm": {"a_b": 1},
+    }
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+async def test_bulk_model_casing(json_backend: str) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, convert_casing=True, json_backend=json_backend)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(List[Record])
+    @validate_response(List[Record])
+    async def index(data: List[Record]) -> ResponseReturnValue:
+        assert data[0].record_details[0].first_name == "bob"
+        return data
+
+    json = [{"recordDetails": [{"firstName": "bob"}], "freeForm": {"someKey": 1}}]
+    test_client = app.test_client()
+    response = await test_client.post("/", json=json)
+    assert response.status_code == 200
+    assert (await response.get_json()) == json
+
+
+async def test_no_casing_decode() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    async def index() -> ResponseReturnValue:
+        return str(await request.get_json())
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"camelCase": 1})
+    assert (await response.get_data(as_text=True)) == "{'camelCase': 1}"
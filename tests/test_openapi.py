@@ -1,18 +1,25 @@
+import gzip
+import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import pytest
 from pydantic import Field
 from quart import Quart
 
 from quart_schema import (
+    DataSource,
     QuartSchema,
+    RequestStream,
     security_scheme,
     validate_headers,
     validate_querystring,
     validate_request,
     validate_response,
 )
-from quart_schema.extension import deprecated
+from quart_schema.extension import _routes_checksum, deprecated
+from quart_schema.pydantic import File
 
 
 @dataclass
@@ -188,3 +195,265 @@ async def test_openapi_refs() -> None:
         "properties"
     ]["resources"]["items"]["$ref"]
     assert ref[len("#/components/schemas/") :] in schema["components"]["schemas"].keys()
+
+
+async def test_openapi_cached() -> None:
+    app = Quart(__name__)
+    quart_schema = QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(Result)
+    async def index() -> Result:
+        return Result(name="bob")
+
+    cache = await quart_schema._get_openapi_cache(app)
+    etag = cache.etag
+
+    @app.route("/other")
+    @validate_response(Employees)
+    async def other() -> Employees:
+        return Employees(resources=[])
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    schema = await response.get_json()
+    assert list(schema["paths"].keys()) == ["/", "/other"]
+    assert "Employee" in schema["components"]["schemas"]
+
+    etag = response.headers["ETag"]
+    response = await test_client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+async def test_openapi_compressed() -> None:
+    app = Quart(__name__)
+    quart_schema = QuartSchema(app, compression=True, compression_threshold=0)
+
+    @app.route("/")
+    @validate_response(Result)
+    async def index() -> Result:
+        return Result(name="bob")
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    schema = json.loads(gzip.decompress(await response.get_data(as_text=False)))
+    assert list(schema["paths"].keys()) == ["/"]
+    cache = await quart_schema._get_openapi_cache(app)
+    assert cache.compressed["gzip"] == await response.get_data(as_text=False)
+
+    etag = response.headers["ETag"]
+    response = await test_client.get(
+        "/openapi.json", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    response = await test_client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+
+
+async def test_docs_assets(tmp_path: Path) -> None:
+    (tmp_path / "swagger-ui-bundle.js").write_text("swagger();")
+    (tmp_path / "swagger-ui.css").write_text("body {}")
+    app = Quart(__name__)
+    quart_schema = QuartSchema(app, docs_assets_folder=str(tmp_path))
+
+    test_client = app.test_client()
+    response = await test_client.get("/docs")
+    page = await response.get_data(as_text=True)
+    assert app.config["QUART_SCHEMA_SWAGGER_JS_URL"] in page
+    assert app.config["QUART_SCHEMA_REDOC_JS_URL"].startswith("https://")
+    response = await test_client.get(app.config["QUART_SCHEMA_SWAGGER_JS_URL"])
+    assert await response.get_data(as_text=False) == b"swagger();"
+    assert response.mimetype in {"application/javascript", "text/javascript"}
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    response = await test_client.get("/docs-assets/swagger-ui-bundle.js")
+    assert response.status_code == 404
+    assert len(quart_schema._docs_pages[app]) == 1
+
+
+async def test_openapi_file(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    def create_app(openapi_file: Optional[str] = None) -> Quart:
+        app = Quart(__name__)
+        QuartSchema(app, openapi_file=openapi_file)
+
+        @app.route("/")
+        @validate_response(Result)
+        async def index() -> Result:
+            return Result(name="bob")
+
+        return app
+
+    path = str(tmp_path / "openapi.json")
+    result = create_app().test_cli_runner().invoke(args=["schema", "--output", path])
+    assert result.exit_code == 0
+
+    app = create_app(path)
+    async with app.test_app():
+        test_client = app.test_client()
+        response = await test_client.get("/openapi.json")
+    assert await response.get_data(as_text=False) == Path(path).read_bytes()
+    assert "does not match" not in caplog.text
+
+    app = create_app(path)
+
+    @app.route("/other")
+    async def other() -> str:
+        return ""
+
+    async with app.test_app():
+        pass
+    assert "does not match" in caplog.text
+
+
+def test_routes_checksum_stable() -> None:
+    @dataclass(frozen=True, repr=False)
+    class Options:
+        verbose: bool = False
+
+    def create_app() -> Quart:
+        # A new default each time, whose repr includes its address
+        @dataclass
+        class Settings:
+            options: Options = Options()
+
+        app = Quart(__name__)
+        QuartSchema(app)
+
+        @app.route("/", methods=["POST"])
+        @validate_request(Settings)
+        async def index() -> str:
+            return ""
+
+        return app
+
+    assert _routes_checksum(create_app()) == _routes_checksum(create_app())
+
+
+async def test_openapi_name_clash() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @dataclass
+    class Employee:
+        id: int
+
+    @dataclass
+    class Team:
+        members: List[Employee]
+
+    @app.route("/")
+    @validate_response(Employees)
+    async def index() -> Employees:
+        return Employees(resources=[])
+
+    @app.route("/team")
+    @validate_response(Team)
+    async def team() -> Team:
+        return Team(members=[])
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = await response.get_json()
+    definitions = schema["components"]["schemas"]
+    assert len(definitions) == 2
+    for path, name in [("/", "resources"), ("/team", "members")]:
+        ref = schema["paths"][path]["get"]["responses"]["200"]["content"]["application/json"][
+            "schema"
+        ]["properties"][name]["items"]["$ref"]
+        assert ref[len("#/components/schemas/") :] in definitions
+
+
+async def test_openapi_stream_sources() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/array", methods=["POST"])
+    @validate_request(Details, source=DataSource.JSON_STREAM)
+    async def array(data: RequestStream) -> str:
+        return ""
+
+    @app.route("/lines", methods=["POST"])
+    @validate_request(Details, source=DataSource.NDJSON)
+    async def lines(data: RequestStream) -> str:
+        return ""
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    paths = (await response.get_json())["paths"]
+    content = paths["/array"]["post"]["requestBody"]["content"]
+    assert content["application/json"]["schema"]["type"] == "array"
+    assert content["application/json"]["schema"]["items"]["title"] == "Details"
+    content = paths["/lines"]["post"]["requestBody"]["content"]
+    assert content["application/x-ndjson"]["schema"]["title"] == "Details"
+
+
+async def test_openapi_bulk_models() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(List[Details])
+    @validate_response(Dict[str, Result])
+    async def index() -> Dict[str, Result]:
+        return {}
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = await response.get_json()
+    operation = schema["paths"]["/"]["post"]
+    request_schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert request_schema["type"] == "array"
+    assert request_schema["items"] == {"$ref": "#/components/schemas/Details"}
+    response_schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    assert response_schema["type"] == "object"
+    assert response_schema["additionalProperties"] == {"$ref": "#/components/schemas/Result"}
+    assert {"Details", "Result"} <= set(schema["components"]["schemas"])
+
+
+async def test_openapi_multipart() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @dataclass
+    class Upload:
+        name: str
+        avatar: File
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Upload, source=DataSource.FORM_MULTIPART)
+    async def index(data: Upload) -> str:
+        return ""
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = await response.get_json()
+    content = schema["paths"]["/"]["post"]["requestBody"]["content"]
+    properties = content["multipart/form-data"]["schema"]["properties"]
+    assert properties["avatar"] == {"title": "Avatar", "type": "string", "format": "binary"}
+
+
+async def test_openapi_binary_formats() -> None:
+    pytest.importorskip("msgpack")
+    app = Quart(__name__)
+    QuartSchema(app, binary_formats=["msgpack"])
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Details)
+    @validate_response(Result)
+    async def index() -> Result:
+        return Result(name="bob")
+
+    test_client = app.test_client()
+    response = await test_client.get("/openapi.json")
+    schema = await response.get_json()
+    operation = schema["paths"]["/"]["post"]
+    assert set(operation["requestBody"]["content"]) == {"application/json", "application/msgpack"}
+    assert set(operation["responses"]["200"]["content"]) == {
+        "application/json",
+        "application/msgpack",
+    }
@@ -1,8 +1,13 @@
+import asyncio
+import gc
+import json
+import threading
+import weakref
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, validator
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 from quart import Quart, websocket
 from quart.views import View
@@ -10,12 +15,25 @@ from quart.views import View
 from quart_schema import (
     DataSource,
     QuartSchema,
+    RequestItemValidationError,
+    RequestStream,
     ResponseReturnValue,
+    ResponseSchemaValidationError,
     SchemaValidationError,
     validate_headers,
     validate_querystring,
     validate_request,
     validate_response,
+    WebsocketStream,
+)
+from quart_schema.pydantic import File
+from quart_schema.streaming import JSONArrayParser, NDJSONParser
+from quart_schema.validation import (
+    _to_pydantic_model,
+    QUART_SCHEMA_PYDANTIC_ATTRIBUTE,
+    QUART_SCHEMA_RESPONSE_ATTRIBUTE,
+    SchemaInvalidError,
+    validate,
 )
 
 
@@ -122,6 +140,101 @@ async def test_request_form_validation(data: dict, status: int) -> None:
     assert response.status_code == status
 
 
+@pytest.mark.parametrize(
+    "source, body, status",
+    [
+        (DataSource.JSON_STREAM, b'[{"name": "bob"}, {"name": "jim", "age": 2}]', 200),
+        (DataSource.JSON_STREAM, b"[]", 200),
+        (DataSource.JSON_STREAM, b'[{"name": "bob"}, {"age": 2}]', 400),
+        (DataSource.JSON_STREAM, b'[{"name": "bob"}', 400),
+        (DataSource.JSON_STREAM, b'{"name": "bob"}', 400),
+        (DataSource.NDJSON, b'{"name": "bob"}\n\n{"name": "jim", "age": 2}', 200),
+        (DataSource.NDJSON, b'{"name": "bob"}\n{"age": 2}\n', 400),
+        (DataSource.NDJSON, b'{"name": "bob"\n', 400),
+    ],
+)
+async def test_request_stream_validation(source: DataSource, body: bytes, status: int) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Details, source=source)
+    async def item(data: RequestStream) -> ResponseReturnValue:
+        return {"names": [details.name async for details in data]}
+
+    test_client = app.test_client()
+    response = await test_client.post("/", data=body)
+    assert response.status_code == status
+    if status == 200:
+        assert len((await response.get_json())["names"]) == body.count(b"name")
+
+
+async def test_request_stream_item_errors() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Details, source=DataSource.NDJSON)
+    async def item(data: RequestStream) -> ResponseReturnValue:
+        names = []
+        errors = []
+        while True:
+            try:
+                details = await data.__anext__()
+            except StopAsyncIteration:
+                break
+            except RequestItemValidationError as error:
+                errors.append(error.index)
+            else:
+                names.append(details.name)
+        return {"errors": errors, "names": names}
+
+    test_client = app.test_client()
+    response = await test_client.post("/", data=b'{"name": "a"}\n{"age": 1}\n{"name": "b"}\n')
+    assert await response.get_json() == {"errors": [1], "names": ["a", "b"]}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_json_array_parser(chunk_size: int) -> None:
+    text = ' [ {"name": "bob", "tags": ["a", "]", "\\"}"]}, 12.5e1 ,"é\\\\", [1, {}], true ] '
+    parser = JSONArrayParser()
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[start : start + chunk_size]))
+    items.extend(parser.feed("", final=True))
+    assert items == [{"name": "bob", "tags": ["a", "]", '"}']}, 125.0, "é\\", [1, {}], True]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_json_array_parser_large_item(chunk_size: int) -> None:
+    item = {"values": [{"name": f"{index}]"} for index in range(1000)]}
+    text = json.dumps([item, item])
+    parser = JSONArrayParser()
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[start : start + chunk_size]))
+    assert items == [item, item]
+    assert parser.feed("", final=True) == []
+
+
+def test_json_array_parser_invalid_item() -> None:
+    parser = JSONArrayParser()
+    parser.feed('[{"a": ')
+    with pytest.raises(ValueError):
+        parser.feed("1], 2")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_ndjson_parser(chunk_size: int) -> None:
+    text = '{"name": "bob"}\n\n[1, 2]\n"é"'
+    parser = NDJSONParser()
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[start : start + chunk_size]))
+    items.extend(parser.feed("", final=True))
+    assert items == [{"name": "bob"}, [1, 2], "é"]
+
+
 @pytest.mark.parametrize(
     "model, return_value, status",
     [
@@ -197,6 +310,224 @@ async def test_websocket_validation() -> None:
         await test_websocket.send_json(INVALID_DICT)
 
 
+@pytest.mark.parametrize(
+    "module_name, name, mimetype",
+    [("cbor2", "cbor", "application/cbor"), ("msgpack", "msgpack", "application/msgpack")],
+)
+async def test_binary_format_validation(module_name: str, name: str, mimetype: str) -> None:
+    module = pytest.importorskip(module_name)
+    dumps = getattr(module, "dumps", getattr(module, "packb", None))
+    loads = getattr(module, "loads", getattr(module, "unpackb", None))
+    app = Quart(__name__)
+    QuartSchema(app, binary_formats=[name])
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Item)
+    @validate_response(Item)
+    async def item(data: Item) -> Item:
+        return data
+
+    @app.websocket("/ws")
+    async def ws() -> None:
+        data = await websocket.receive_as(Item, binary_format=name)  # type: ignore
+        await websocket.send_as(data, Item, binary_format=name)  # type: ignore
+
+    test_client = app.test_client()
+    headers = {"Content-Type": mimetype, "Accept": mimetype}
+    response = await test_client.post("/", data=dumps(VALID_DICT), headers=headers)
+    assert response.mimetype == mimetype
+    assert "Accept" in response.vary
+    assert loads(await response.get_data()) == VALID.dict()
+    response = await test_client.post("/", data=dumps(INVALID_DICT), headers=headers)
+    assert response.status_code == 400
+    response = await test_client.post("/", data=b"\xc1", headers=headers)
+    assert response.status_code == 400
+    response = await test_client.post("/", json=VALID_DICT)
+    assert response.mimetype == "application/json"
+    assert "Accept" in response.vary
+    assert (await response.get_json()) == VALID.dict()
+
+    async with test_client.websocket("/ws") as test_websocket:
+        await test_websocket.send(dumps(VALID_DICT))
+        assert loads(await test_websocket.receive()) == VALID.dict()
+
+
+@pytest.mark.parametrize("max_queue", [None, 1])
+async def test_websocket_iter_validation(max_queue: Optional[int]) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.websocket("/ws")
+    async def ws() -> None:
+        items: List[Item] = []
+        messages = websocket.iter_as(Item, max_queue)  # type: ignore
+        while len(items) < 2:
+            try:
+                items.append(await messages.__anext__())
+            except SchemaValidationError:
+                pass
+        with pytest.raises(SchemaValidationError):
+            await websocket.send_many_as([VALID_DICT, INVALID_DICT], Item)  # type: ignore
+        await websocket.send_many_as(items, Item)  # type: ignore
+
+    test_client = app.test_client()
+    async with test_client.websocket("/ws") as test_websocket:
+        await test_websocket.send_json(VALID_DICT)
+        await test_websocket.send_json(INVALID_DICT)
+        await test_websocket.send_json(VALID_DICT)
+        assert await test_websocket.receive_json() == VALID.dict()
+        assert await test_websocket.receive_json() == VALID.dict()
+
+
+class _ListWebsocket:
+    def __init__(self, messages: List[str], block: bool) -> None:
+        self.messages = messages
+        self.block = block
+
+    async def receive(self) -> str:
+        if self.messages:
+            return self.messages.pop()
+        elif self.block:
+            await asyncio.Event().wait()
+        raise ConnectionError()
+
+    async def send(self, data: str) -> None:
+        pass
+
+
+async def test_websocket_stream_drains_queue() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    async with app.app_context():
+        websocket_: Any = _ListWebsocket([json.dumps(VALID_DICT)] * 3, block=False)
+        items = []
+        with pytest.raises(ConnectionError):
+            async for item in WebsocketStream(websocket_, Item, max_queue=5):
+                items.append(item)
+        assert items == [VALID] * 3
+
+
+async def test_websocket_stream_stops_receiving() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    async with app.app_context():
+        websocket_: Any = _ListWebsocket([json.dumps(VALID_DICT)] * 3, block=True)
+        async with WebsocketStream(websocket_, Item, max_queue=1) as stream:
+            await stream.__anext__()
+            task = stream._task
+        await asyncio.sleep(0)
+        assert task is not None and task.cancelled()
+
+        websocket_ = _ListWebsocket([json.dumps(VALID_DICT)] * 3, block=True)
+        stream = WebsocketStream(websocket_, Item, max_queue=1)
+        async for _ in stream:
+            break
+        task = stream._task
+        del stream  # Without closing
+        await asyncio.sleep(0)
+        assert task is not None and task.cancelled()
+
+
+@pytest.mark.parametrize("check_schemas", [True, False])
+async def test_deferred_schema_checks(check_schemas: bool) -> None:
+    @dataclass
+    class RequiredQuery:
+        count: int
+
+    app = Quart(__name__)
+    QuartSchema(app, check_schemas=check_schemas)
+
+    @app.route("/")
+    @validate_querystring(RequiredQuery)
+    async def item(query_args: RequiredQuery) -> ResponseReturnValue:
+        return ""
+
+    # Nothing is converted or checked until the app starts serving
+    assert QUART_SCHEMA_PYDANTIC_ATTRIBUTE not in vars(RequiredQuery)
+    if check_schemas:
+        with pytest.raises(SchemaInvalidError):
+            await app.startup()
+    else:
+        await app.startup()
+        assert QUART_SCHEMA_PYDANTIC_ATTRIBUTE in vars(RequiredQuery)
+
+
+async def test_pydantic_conversions_interned() -> None:
+    async def _serve_dynamic_models() -> "weakref.ref[type]":
+        @dataclass
+        class Dynamic:
+            name: str
+
+        @dataclass
+        class Wrapper:
+            dynamic: Dynamic
+
+        app = Quart(__name__)
+        QuartSchema(app)
+
+        @app.route("/a", methods=["POST"])
+        @validate_request(Dynamic)
+        async def a(data: Dynamic) -> ResponseReturnValue:
+            return ""
+
+        @app.route("/b", methods=["POST"])
+        @validate_request(Wrapper)
+        async def b(data: Wrapper) -> ResponseReturnValue:
+            return ""
+
+        test_client = app.test_client()
+        await test_client.post("/a", json={"name": "bob"})
+        await test_client.post("/b", json={"dynamic": {"name": "bob"}})
+        converted = _to_pydantic_model(Dynamic)
+        assert _to_pydantic_model(Dynamic) is converted
+        response = await test_client.get("/openapi.json")
+        assert list((await response.get_json())["components"]["schemas"]) == ["Dynamic"]
+        return weakref.ref(Wrapper)
+
+    # Interned conversions must not keep dynamically created models
+    # alive (pydantic itself keeps nested dataclasses, like Dynamic)
+    reference = await _serve_dynamic_models()
+    gc.collect()
+    assert reference() is None
+
+
+@pytest.mark.parametrize(
+    "names, status, offloaded",
+    [
+        (["bob"], 200, False),
+        (["bob"] * 100, 200, True),
+        (["bob"] * 99 + [None], 400, True),
+    ],
+)
+async def test_offloaded_validation(names: List[Any], status: int, offloaded: bool) -> None:
+    threads = set()
+
+    class Names(BaseModel):
+        names: List[str]
+
+        @validator("names", allow_reuse=True)
+        def record_thread(cls, value: List[str]) -> List[str]:  # noqa: N805
+            threads.add(threading.current_thread())
+            return value
+
+    app = Quart(__name__)
+    QuartSchema(app, offload_threshold=256, offload_workers=1)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Names)
+    async def item(data: Names) -> ResponseReturnValue:
+        return {"count": len(data.names)}
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"names": names})
+    assert response.status_code == status
+    if status == 200:
+        assert threads
+        assert (threading.main_thread() not in threads) == offloaded
+
+
 @pytest.mark.parametrize(
     "path, status",
     [
@@ -251,11 +582,36 @@ async def test_request_header_validation(request_headers: dict, status: int) ->
     assert response.status_code == status
 
 
+class BaseHeaders(BaseModel):
+    x_required: str
+
+
+class AliasedHeaders(BaseHeaders):
+    forwarded: Optional[str] = Field(None, alias="X-Forwarded-For")
+
+
+async def test_request_header_inherited_aliased() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_headers(AliasedHeaders)
+    async def headers_item(headers: AliasedHeaders) -> ResponseReturnValue:
+        return {"required": headers.x_required, "forwarded": headers.forwarded}
+
+    test_client = app.test_client()
+    response = await test_client.get(
+        "/", headers={"X-Required": "abc", "X-Forwarded-For": "1.2.3.4"}
+    )
+    assert (await response.get_json()) == {"required": "abc", "forwarded": "1.2.3.4"}
+
+
 @pytest.mark.parametrize(
     "response_headers, status",
     [
         ({"X-Required": "abc", "X-Optional": "2"}, 200),
         ({"X-Required": "abc", "User-Agent": "abc"}, 200),
+        ({"x_required": "abc", "x_optional": "2"}, 200),
         (Headers(x_required="abc"), 200),
         ({}, 500),
         ({"X-Required": "abc", "X-Optional": "abc"}, 500),
@@ -274,3 +630,405 @@ async def test_response_header_validation(response_headers: dict, status: int) -
     test_client = app.test_client()
     response = await test_client.get("/")
     assert response.status_code == status
+
+
+async def test_response_header_model_instance() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(DCItem, 200, BaseHeaders)
+    async def headers_item() -> Tuple[dict, int, BaseHeaders]:
+        return VALID_DICT, 200, BaseHeaders(x_required="abc")
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert response.status_code == 200
+    assert response.headers["x_required"] == "abc"
+
+
+class SecretItem(Item):
+    secret: str
+
+
+# Constructed without validation, as a trusted response value may be
+INVALID_ITEM = Item.construct(count="a", details=Details(name="bob"))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "return_value, strict, status",
+    [
+        (INVALID_ITEM, False, 200),
+        (INVALID_ITEM, True, 500),
+        (SecretItem(count=2, details=Details(name="bob"), secret="abc"), False, 200),
+        (SecretItem(count=2, details=Details(name="bob"), secret="abc"), True, 200),
+    ],
+)
+async def test_response_validation_trusted(return_value: Item, strict: bool, status: int) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(Item, strict=strict)
+    async def item() -> ResponseReturnValue:
+        return return_value
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert response.status_code == status
+    if status == 200:
+        assert "secret" not in await response.get_json()
+
+
+@pytest.mark.parametrize(
+    "sample, debug, status, reported",
+    [
+        (0.9, False, 200, False),
+        (0.1, False, 200, True),
+        (0.9, True, 500, False),
+    ],
+)
+async def test_response_validation_sampled(
+    sample: float, debug: bool, status: int, reported: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("quart_schema.validation.random", lambda: sample)
+    app = Quart(__name__)
+    app.debug = debug
+    quart_schema = QuartSchema(app, response_sample_rate=0.5)
+    errors = []
+
+    @quart_schema.response_failure_handler
+    async def report(error: ResponseSchemaValidationError) -> None:
+        errors.append(error)
+
+    @app.route("/")
+    @validate_response(Item)
+    async def item() -> ResponseReturnValue:
+        return INVALID_DICT
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert response.status_code == status
+    assert (len(errors) == 1) == reported
+
+
+@pytest.mark.parametrize(
+    "accept, values, expected",
+    [
+        ("application/json", [], b"[]"),
+        ("*/*", [VALID_DICT, VALID], b'[{"count":2,"details":{"age":null,"name":"bob"}},'),
+        ("application/x-ndjson", [VALID, VALID_DICT], b'{"count":2,"details":{"age":null,'),
+    ],
+)
+async def test_response_stream_validation(accept: str, values: list, expected: bytes) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(Item)
+    async def items() -> ResponseReturnValue:
+        async def generate() -> AsyncGenerator[Any, None]:
+            for value in values:
+                yield value
+
+        return generate()
+
+    test_client = app.test_client()
+    response = await test_client.get("/", headers={"Accept": accept})
+    assert response.status_code == 200
+    body = await response.get_data(as_text=False)
+    assert body.startswith(expected)
+    if accept == "application/x-ndjson":
+        assert response.mimetype == "application/x-ndjson"
+        assert [json.loads(line) for line in body.splitlines()] == [VALID.dict()] * 2
+    else:
+        assert response.mimetype == "application/json"
+        assert json.loads(body) == [VALID.dict()] * len(values)
+
+
+async def test_response_stream_invalid_first() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(Item)
+    async def items() -> ResponseReturnValue:
+        async def generate() -> AsyncGenerator[Any, None]:
+            yield INVALID_DICT
+
+        return generate()
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert response.status_code == 500
+
+
+@pytest.mark.parametrize(
+    "model, json, status",
+    [
+        (List[Details], [{"name": "bob"}, {"name": "jim", "age": 2}], 200),
+        (List[Details], [{"name": "bob"}, {"age": 2}], 400),
+        (List[Details], {"name": "bob"}, 400),
+        (Dict[str, DCDetails], {"a": {"name": "bob"}}, 200),
+        (Dict[str, DCDetails], {"a": {"age": 2}}, 400),
+    ],
+)
+async def test_request_bulk_validation(model: Any, json: Any, status: int) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(model)
+    async def items(data: Any) -> ResponseReturnValue:
+        values = data.values() if isinstance(data, dict) else data
+        return {"names": [value.name for value in values]}
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json=json)
+    assert response.status_code == status
+
+
+@pytest.mark.parametrize(
+    "model, return_value, status",
+    [
+        (List[Item], [VALID_DICT, VALID], 200),
+        (List[Item], [VALID_DICT, INVALID_DICT], 500),
+        (List[Item], VALID_DICT, 500),
+        (Dict[str, DCItem], {"a": VALID_DICT, "b": VALID_DC}, 200),
+        (Dict[str, DCItem], {"a": INVALID_DICT}, 500),
+    ],
+)
+async def test_response_bulk_validation(model: Any, return_value: Any, status: int) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(model)
+    async def items() -> ResponseReturnValue:
+        return return_value
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert response.status_code == status
+    if status == 200:
+        expected = {"count": 2, "details": {"age": None, "name": "bob"}}
+        values = await response.get_json()
+        assert list(values.values() if isinstance(values, dict) else values) == [expected] * 2
+
+
+async def test_validation_pipeline() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    async def handler(
+        data: Details, query_args: QueryItem, headers: Headers
+    ) -> ResponseReturnValue:
+        return VALID_DICT, int(data.age or 200)
+
+    route = validate_request(Details)(handler)
+    route = validate_querystring(QueryItem)(route)
+    route = validate_headers(Headers)(route)
+    route = validate_response(Item, 200)(route)
+    route = validate_response(Details, 201)(route)
+    assert route.__wrapped__ is handler
+    app.add_url_rule("/", "index", route, methods=["POST"])
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"name": "bob"}, headers={"X-Required": "Hello"})
+    assert response.status_code == 200
+    response = await test_client.post(
+        "/", json={"name": "bob", "age": 201}, headers={"X-Required": "Hello"}
+    )
+    assert response.status_code == 500  # VALID_DICT isn't valid Details
+    response = await test_client.post("/", json={"name": "bob"})
+    assert response.status_code == 400
+
+
+async def test_validation_pipeline_reused() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    async def handler(data: Details) -> ResponseReturnValue:
+        return VALID_DICT
+
+    route = validate_request(Details)(handler)
+    app.add_url_rule("/", "index", route, methods=["POST"])
+    strict_route = validate_response(Details)(route)
+    app.add_url_rule("/strict", "strict", strict_route, methods=["POST"])
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"name": "bob"})
+    assert response.status_code == 200
+    response = await test_client.post("/strict", json={"name": "bob"})
+    assert response.status_code == 500  # VALID_DICT isn't valid Details
+    assert QUART_SCHEMA_RESPONSE_ATTRIBUTE not in vars(route)
+
+
+async def test_validate_shorthand() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate(request=Details, responses={200: (Item, None)})
+    async def index(data: Details) -> ResponseReturnValue:
+        return INVALID_DICT
+
+    test_client = app.test_client()
+    response = await test_client.post("/", json={"name": "bob"})
+    assert response.status_code == 500
+
+
+class SearchQuery(BaseModel):
+    term: Optional[str] = None
+    page: int = 1
+    exact: Optional[bool] = None
+    tags: List[str] = []
+
+
+@dataclass
+class DCSearchQuery:
+    ids: Optional[List[int]] = None
+    limit: Optional[int] = None
+
+
+@pytest.mark.parametrize(
+    "model, path, status, expected",
+    [
+        (SearchQuery, "/", 200, {"term": None, "page": 1, "exact": None, "tags": []}),
+        (
+            SearchQuery,
+            "/?term=a&page=2&exact=Yes&tags=b&tags=c",
+            200,
+            {"term": "a", "page": 2, "exact": True, "tags": ["b", "c"]},
+        ),
+        (SearchQuery, "/?page=a", 400, None),
+        (SearchQuery, "/?exact=maybe", 400, None),
+        (DCSearchQuery, "/?ids=1&ids=2&limit=3", 200, {"ids": [1, 2], "limit": 3}),
+        (DCSearchQuery, "/?ids=1&ids=a", 400, None),
+    ],
+)
+async def test_querystring_parsing(
+    model: Any, path: str, status: int, expected: Optional[dict]
+) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_querystring(model)
+    async def query_item(query_args: Any) -> ResponseReturnValue:
+        return query_args
+
+    test_client = app.test_client()
+    response = await test_client.get(path)
+    assert response.status_code == status
+    if expected is not None:
+        assert (await response.get_json()) == expected
+
+
+@pytest.mark.parametrize("path, status", [("/?a=1", 200), ("/?b=1", 400)])
+async def test_querystring_missing_required(path: str, status: int) -> None:
+    class Query(BaseModel):
+        a: int
+        b: Optional[int]
+
+    app = Quart(__name__)
+    QuartSchema(app, check_schemas=False)
+
+    @app.route("/")
+    @validate_querystring(Query)
+    async def query_item(query_args: Query) -> ResponseReturnValue:
+        return query_args
+
+    test_client = app.test_client()
+    response = await test_client.get(path)
+    assert response.status_code == status
+
+
+class Upload(BaseModel):
+    name: str
+    count: int = 1
+    avatar: File = Field(..., max_size=16)
+    attachments: List[File] = []
+
+
+def _multipart(parts: List[Tuple[str, Optional[str], bytes]]) -> Tuple[bytes, dict]:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += f"--boundary\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+        body += content + b"\r\n"
+    body += b"--boundary--\r\n"
+    return body, {"Content-Type": "multipart/form-data; boundary=boundary"}
+
+
+@pytest.mark.parametrize(
+    "parts, status",
+    [
+        ([("name", None, b"bob"), ("avatar", "a.png", b"abc")], 200),
+        ([("name", None, b"bob"), ("avatar", "a.png", b"a" * 17)], 413),
+        ([("count", None, b"a"), ("avatar", "a.png", b"abc")], 400),
+        ([("name", None, b"bob")], 400),
+        ([("name", None, b"bob"), ("avatar", None, b"abc")], 400),
+        ([("name", None, b"bob"), ("other", "o.bin", b"o" * 64), ("avatar", "a.png", b"abc")], 200),
+    ],
+)
+async def test_request_multipart_validation(
+    parts: List[Tuple[str, Optional[str], bytes]], status: int
+) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Upload, source=DataSource.FORM_MULTIPART)
+    async def upload(data: Upload) -> ResponseReturnValue:
+        return {
+            "name": data.name,
+            "avatar": data.avatar.read().decode(),
+            "attachments": [attachment.filename for attachment in data.attachments],
+        }
+
+    test_client = app.test_client()
+    body, headers = _multipart(parts + [("attachments", "b.txt", b"b"), ("attachments", "c", b"")])
+    response = await test_client.post("/", data=body, headers=headers)
+    assert response.status_code == status
+    if status == 200:
+        assert (await response.get_json()) == {
+            "name": "bob",
+            "avatar": "abc",
+            "attachments": ["b.txt", "c"],
+        }
+
+
+class Signup(BaseModel):
+    password: str
+    confirm: str
+
+    @validator("confirm")
+    def passwords_match(cls, value: str, values: Dict[str, Any]) -> str:  # noqa: N805
+        if value != values.get("password"):
+            raise ValueError("Passwords do not match")
+        return value
+
+
+@pytest.mark.parametrize(
+    "confirm, status",
+    [
+        (b"secret", 200),
+        (b"other", 400),
+    ],
+)
+async def test_request_multipart_dependent_validation(confirm: bytes, status: int) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/", methods=["POST"])
+    @validate_request(Signup, source=DataSource.FORM_MULTIPART)
+    async def signup(data: Signup) -> ResponseReturnValue:
+        return ""
+
+    test_client = app.test_client()
+    body, headers = _multipart([("password", None, b"secret"), ("confirm", None, confirm)])
+    response = await test_client.post("/", data=body, headers=headers)
+    assert response.status_code == status